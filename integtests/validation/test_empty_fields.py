@@ -1,89 +1,118 @@
 """Test for empty/invalid string fields in entities."""
 
 import asyncio
-import json
-import re
-from typing import Any, Dict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Any, Dict, List, Tuple
 
 import pytest
 
+from nes.core.identifiers import build_entity_id
 from nes.database.file_database import FileDatabase
 
+# Placeholder words in every letter case, so lookups need no .lower() call.
+# Symbol runs such as "...", "---" or "___" have no alphanumerics and are
+# caught by the ratio check instead.
+_PLACEHOLDER_WORDS = frozenset(
+    "".join(chars)
+    for word in ("na", "n/a", "tbd", "null", "none")
+    for chars in product(*({c.lower(), c.upper()} for c in word))
+)
+
 
 def is_invalid_string(value: str) -> bool:
     """Check if string contains only symbols, whitespace, or placeholder text."""
-    if not value or not value.strip():
+    stripped = value.strip()
+    if not stripped:
         return True
 
-    # Check for placeholder patterns like "...", "---", "N/A", etc.
-    placeholder_patterns = [
-        r"^\.{2,}$",  # dots only
-        r"^-{2,}$",  # dashes only
-        r"^_{2,}$",  # underscores only
-        r"^n/?a$",  # N/A variations
-        r"^tbd$",  # to be determined
-        r"^null$",  # null string
-        r"^none$",  # none string
-    ]
-
-    for pattern in placeholder_patterns:
-        if re.match(pattern, value.strip().lower()):
-            return True
+    if len(stripped) <= 4 and stripped in _PLACEHOLDER_WORDS:
+        return True
 
     # Check if string is mostly symbols/whitespace (>80% non-alphanumeric)
-    alphanumeric_count = sum(1 for c in value if c.isalnum())
-    if len(value) > 0 and alphanumeric_count / len(value) < 0.2:
+    alphanumeric_count = sum(map(str.isalnum, value))
+    if alphanumeric_count / len(value) < 0.2:
         return True
 
     return False
 
 
-def check_dict_strings(data: Dict[str, Any], path: str = "") -> list:
-    """Recursively check dictionary for invalid string values."""
-    issues = []
-
-    for key, value in data.items():
-        current_path = f"{path}.{key}" if path else key
+def check_dict_strings(data: Dict[str, Any], path: Tuple[str, ...] = ()) -> list:
+    """Walk a dictionary depth-first and collect invalid string values.
 
-        if isinstance(value, str) and is_invalid_string(value):
-            issues.append(f"{current_path}: '{value}'")
+    The path is carried as a tuple of segments and only joined into a dotted
+    string when an issue is recorded.
+    """
+    issues = []
+    # Items are pushed in reverse and popped LIFO, so values are visited (and
+    # issues reported) in document order, as with a recursive walk
+    stack = [(path + (key,), value) for key, value in reversed(data.items())]
+
+    while stack:
+        item_path, value = stack.pop()
+        # Unset optional fields are stored as null; skip them before paying
+        # for any isinstance dispatch
+        if value is None:
+            continue
+        if isinstance(value, str):
+            if is_invalid_string(value):
+                issues.append(f"{'.'.join(item_path)}: '{value}'")
         elif isinstance(value, dict):
-            issues.extend(check_dict_strings(value, current_path))
+            stack.extend(
+                (item_path + (key,), child) for key, child in reversed(value.items())
+            )
         elif isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, str) and is_invalid_string(item):
-                    issues.append(f"{current_path}[{i}]: '{item}'")
-                elif isinstance(item, dict):
-                    issues.extend(check_dict_strings(item, f"{current_path}[{i}]"))
+            parent, key = item_path[:-1], item_path[-1]
+            stack.extend(
+                (parent + (f"{key}[{i}]",), item)
+                for i, item in reversed(list(enumerate(value)))
+                if isinstance(item, (str, dict))
+            )
 
     return issues
 
 
+def _scan_batch(batch: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """Check a batch of (entity_id, entity_dict) pairs in a worker process."""
+    batch_issues = []
+    for entity_id, entity_json in batch:
+        issues = check_dict_strings(entity_json)
+        if issues:
+            batch_issues.extend([f"{entity_id}: {issue}" for issue in issues])
+    return batch_issues
+
+
 @pytest.mark.asyncio
 async def test_empty_fields():
     """Test all entities for empty/invalid string fields."""
     db = FileDatabase()
-    entities = await db.list_entities(limit=100_000)
+    entities = await db.list_entities_raw(limit=100_000)
 
     print(f"Checking {len(entities)} entities for invalid string fields...")
 
     batch_size = 1000
     total_issues = []
 
-    for i in range(0, len(entities), batch_size):
-        batch = entities[i : i + batch_size]
-        batch_issues = []
-
-        for entity in batch:
-            entity_json = json.loads(entity.model_dump_json())
-            issues = check_dict_strings(entity_json)
-            if issues:
-                batch_issues.extend([f"{entity.id}: {issue}" for issue in issues])
+    entity_dicts = [
+        (build_entity_id(data["type"], data.get("sub_type"), data["slug"]), data)
+        for data in entities
+    ]
+    batches = [
+        entity_dicts[i : i + batch_size]
+        for i in range(0, len(entity_dicts), batch_size)
+    ]
 
-        total_issues.extend(batch_issues)
-        print(
-            f"Processed {min(i + batch_size, len(entities))}/{len(entities)} entities, found {len(batch_issues)} issues in this batch"
-        )
+    processed = 0
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for batch, batch_issues in zip(
+            batches, executor.map(_scan_batch, batches, chunksize=1)
+        ):
+            processed += len(batch)
+            total_issues.extend(batch_issues)
+            print(
+                f"Processed {processed}/{len(entities)} entities, found {len(batch_issues)} issues in this batch"
+            )
 
     print(f"\nTotal issues found: {len(total_issues)}")
 
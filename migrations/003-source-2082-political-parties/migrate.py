@@ -5,20 +5,17 @@ Author: Damodar Dahal
 Date: 2025-11-11
 """
 
+import functools
 from datetime import date
 
 from nepali_date_utils import converter
 
 from nes.core.models import (
-    Address,
     Attribution,
     Contact,
     ExternalIdentifier,
     LangText,
     LangTextValue,
-    Name,
-    NameParts,
-    PartySymbol,
 )
 from nes.core.models.base import NameKind
 from nes.core.models.entity import EntitySubType, EntityType
@@ -81,6 +78,9 @@ PARTY_ADDITIONAL_NAME_MAP_REVERSE = {
 }
 
 
+# Many parties share a registration date (57 of 124 on 2073-08-30), so each
+# distinct date is only transliterated and converted once
+@functools.lru_cache(maxsize=4096)
 def convert_nepali_date(date_str: str) -> date:
     """Convert Nepali date to date object."""
     date_roman = transliterate_to_roman(date_str)
@@ -91,6 +91,14 @@ def convert_nepali_date(date_str: str) -> date:
     return date(int(y), int(m), int(d))
 
 
+def _langtext(en, ne, prov_en="human", prov_ne="human") -> dict:
+    """Build a plain dict matching the LangText schema."""
+    return {
+        "en": {"value": en, "provenance": prov_en},
+        "ne": {"value": ne, "provenance": prov_ne},
+    }
+
+
 reg_no_external_identifier = LangText(
     en=LangTextValue(
         value="Election Commission Registration Number (2082)", provenance="human"
@@ -98,6 +106,15 @@ reg_no_external_identifier = LangText(
     ne=LangTextValue(value="निर्वाचन आयोग दर्ता नं.", provenance="human"),
 )
 
+# Same source attribution for every party; validated once at import
+_ATTRIBUTION_DUMP = Attribution(
+    title=_langtext("Nepal Election Commission", "नेपाल निर्वाचन आयोग"),
+    details=_langtext(
+        f"Registered Parties (2082) - imported {DATE}",
+        f"दर्ता भएका दलहरू (२०८२) - आयात मिति {DATE} A.D.",
+    ),
+).model_dump()
+
 
 async def migrate(context: MigrationContext) -> None:
     """
@@ -123,7 +140,7 @@ async def migrate(context: MigrationContext) -> None:
     # Create lookup by Nepali name
     raw_lookup = {row["दलको नाम"]: row for row in raw_data}
 
-    count = 0
+    prepared = []
     for name_ne, translated in party_data.items():
         raw_row = raw_lookup.get(name_ne)
         if not raw_row:
@@ -145,20 +162,18 @@ async def migrate(context: MigrationContext) -> None:
         # Build address
         address = None
         if translated.get("address"):
-            address = Address(
-                description=f"{translated['address']} / {raw_row.get('दलको मुख्य कार्यालय (ठेगाना)', '')}"
-            )
+            address = {
+                "description": f"{translated['address']} / {raw_row.get('दलको मुख्य कार्यालय (ठेगाना)', '')}"
+            }
 
         # Build party_chief
         party_chief = None
         if translated.get("main_person"):
-            party_chief = LangText(
-                en=LangTextValue(
-                    value=translated["main_person"], provenance="translation_service"
-                ),
-                ne=LangTextValue(
-                    value=raw_row.get("प्रमुख पदाधिकारीको नाम", ""), provenance="imported"
-                ),
+            party_chief = _langtext(
+                translated["main_person"],
+                raw_row.get("प्रमुख पदाधिकारीको नाम", ""),
+                prov_en="translation_service",
+                prov_ne="imported",
             )
 
         # Build registration_date
@@ -169,17 +184,14 @@ async def migrate(context: MigrationContext) -> None:
         # Build symbol
         symbol = None
         if translated.get("symbol_name"):
-            symbol = PartySymbol(
-                name=LangText(
-                    en=LangTextValue(
-                        value=translated["symbol_name"],
-                        provenance="translation_service",
-                    ),
-                    ne=LangTextValue(
-                        value=raw_row.get("चिन्हको नाम", ""), provenance="imported"
-                    ),
+            symbol = {
+                "name": _langtext(
+                    translated["symbol_name"],
+                    raw_row.get("चिन्हको नाम", ""),
+                    prov_en="translation_service",
+                    prov_ne="imported",
                 )
-            )
+            }
 
         # Build contacts
         contacts = None
@@ -193,63 +205,43 @@ async def migrate(context: MigrationContext) -> None:
         name_ne = name_extractor.standardize_name(name_ne)
         # Build names (primary + additional if found in reverse map)
         names = [
-            Name(
-                kind=NameKind.PRIMARY,
-                en=NameParts(full=name_extractor.standardize_name(translated["name"])),
-                ne=NameParts(full=name_ne),
-            ).model_dump()
+            {
+                "kind": NameKind.PRIMARY,
+                "en": {"full": name_extractor.standardize_name(translated["name"])},
+                "ne": {"full": name_ne},
+            }
         ]
         if name_ne in PARTY_ADDITIONAL_NAME_MAP_REVERSE:
             original_name = PARTY_ADDITIONAL_NAME_MAP_REVERSE[name_ne]
-            names.append(
-                Name(
-                    kind=NameKind.ALTERNATE,
-                    ne=NameParts(full=original_name),
-                ).model_dump()
-            )
+            names.append({"kind": NameKind.ALTERNATE, "ne": {"full": original_name}})
 
         # Create entity
         party_data = dict(
             slug=text_to_slug(translated["name"]),
             names=names,
-            attributions=[
-                Attribution(
-                    title=LangText(
-                        en=LangTextValue(
-                            value="Nepal Election Commission", provenance="human"
-                        ),
-                        ne=LangTextValue(value="नेपाल निर्वाचन आयोग", provenance="human"),
-                    ),
-                    details=LangText(
-                        en=LangTextValue(
-                            value=f"Registered Parties (2082) - imported {DATE}",
-                            provenance="human",
-                        ),
-                        ne=LangTextValue(
-                            value=f"दर्ता भएका दलहरू (२०८२) - आयात मिति {DATE} A.D.",
-                            provenance="human",
-                        ),
-                    ),
-                )
-            ],
+            attributions=[_ATTRIBUTION_DUMP],
             identifiers=identifiers,
             contacts=contacts,
-            address=address.model_dump() if address else None,
-            party_chief=party_chief.model_dump() if party_chief else None,
+            address=address,
+            party_chief=party_chief,
             registration_date=registration_date,
-            symbol=symbol.model_dump() if symbol else None,
+            symbol=symbol,
         )
 
-        party = await context.publication.create_entity(
-            entity_type=EntityType.ORGANIZATION,
-            entity_subtype=EntitySubType.POLITICAL_PARTY,
-            entity_data=party_data,
-            author_id=author_id,
-            change_description=CHANGE_DESCRIPTION,
-        )
-        context.log(f"Created party {party.id}")
+        prepared.append(party_data)
 
-        count += 1
+    # Validate the whole batch up front, then write it in one pass
+    parties = await context.publication.create_entities_bulk(
+        entity_type=EntityType.ORGANIZATION,
+        entity_subtype=EntitySubType.POLITICAL_PARTY,
+        entities_data=prepared,
+        author_id=author_id,
+        change_description=CHANGE_DESCRIPTION,
+    )
+
+    for party in parties:
+        context.log(f"Created party {party.id}")
+    count = len(parties)
 
     context.log(f"Created {count} political parties")
 
@@ -11,6 +11,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -52,6 +53,49 @@ class CandidateTranslation(BaseModel):
     description: str = Field(default="", description="Other information in English")
 
 
+# The output schema and the defaulted fields never change between candidates
+CANDIDATE_TRANSLATION_SCHEMA = CandidateTranslation.model_json_schema()
+_OPTIONAL_FIELD_DEFAULTS = {
+    name: field.default
+    for name, field in CandidateTranslation.model_fields.items()
+    if not field.is_required()
+}
+
+
+def save_translations(output_file: Path, translations: dict) -> None:
+    """Write the canonical translations.json file."""
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(translations, f, ensure_ascii=False, indent=2)
+
+
+def replay_checkpoint(checkpoint_file: Path, translations: dict) -> int:
+    """Merge translations from an append-only NDJSON checkpoint.
+
+    Returns the number of entries replayed. A truncated trailing line (from an
+    interrupted write) is ignored.
+    """
+    if not checkpoint_file.exists():
+        return 0
+
+    replayed = 0
+    with open(checkpoint_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                translations.update(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+            replayed += 1
+    return replayed
+
+
+# Number of new translations between rewrites of translations.json
+CHECKPOINT_INTERVAL = 100
+
+# Candidates dispatched per gather, and concurrent requests to the provider.
+# Tune TRANSLATION_CONCURRENCY to the Vertex AI requests-per-minute quota.
+CHUNK_SIZE = 32
+TRANSLATION_CONCURRENCY = 8
+
 INSTRUCTIONS = """
 You are a translation system converting Nepali election candidate information to English.
 Translate all text fields to English while preserving proper names accurately.
@@ -64,34 +108,49 @@ async def translate_candidate(
 ) -> dict:
     """Translate a single candidate's data from Nepali to English."""
 
-    # Create input model
-    candidate_data = CandidateTranslation(
-        name=candidate["CandidateName"],
-        father_name=candidate.get("FATHER_NAME", ""),
-        spouse_name=candidate.get("SPOUCE_NAME", ""),
-        address=candidate.get("ADDRESS", ""),
-        party_name=candidate.get("PoliticalPartyName", ""),
-        experience=candidate.get("EXPERIENCE", ""),
-        qualification=candidate.get("QUALIFICATION", ""),
-        other_details=candidate.get("OTHERDETAILS", ""),
-        symbol_name=candidate.get("SymbolName", ""),
-    ).model_dump()
-
-    candidate_data["experience"] = candidate.get("EXPERIENCE") or ""
-    candidate_data["qualification"] = candidate.get("QUALIFICATION") or ""
-    candidate_data["other_details"] = candidate.get("OTHERDETAILS") or ""
-    candidate_data["institution_name"] = candidate.get("NAMEOFINST") or ""
+    # Build the prompt payload directly; the model only describes the output
+    candidate_data = {
+        "name": candidate["CandidateName"],
+        "father_name": candidate.get("FATHER_NAME", ""),
+        "spouse_name": candidate.get("SPOUCE_NAME", ""),
+        "address": candidate.get("ADDRESS", ""),
+        "party_name": candidate.get("PoliticalPartyName", ""),
+        "experience": candidate.get("EXPERIENCE") or "",
+        "qualification": candidate.get("QUALIFICATION") or "",
+        "other_details": candidate.get("OTHERDETAILS") or "",
+        "symbol_name": candidate.get("SymbolName", ""),
+        **_OPTIONAL_FIELD_DEFAULTS,
+        "institution_name": candidate.get("NAMEOFINST") or "",
+    }
 
     # Extract structured translation
     result = await provider.extract_structured_data(
         f"Translate this: {candidate_data}",
-        CandidateTranslation.model_json_schema(),
+        CANDIDATE_TRANSLATION_SCHEMA,
         instructions=INSTRUCTIONS,
     )
 
     return result
 
 
+async def _translate(
+    sem: asyncio.Semaphore, provider: GoogleVertexAIProvider, candidate: dict
+) -> Optional[dict]:
+    """Translate one candidate under the semaphore.
+
+    Returns None when the model's response for this candidate is empty or not
+    valid JSON, so the next run retries it. Any other error (credentials,
+    quota, project configuration) is raised and stops the run, as it would
+    fail for every remaining candidate too.
+    """
+    async with sem:
+        try:
+            return await translate_candidate(provider, candidate)
+        except ValueError as e:
+            print(f"  ✗ {candidate['CandidateName']}: {e}")
+            return None
+
+
 async def main():
     """Main function to generate translations."""
     # Load environment variables
@@ -114,16 +173,12 @@ async def main():
     print("Loading raw candidate data...")
 
     # Read raw JSON files
-    central_data = []
-    state_data = []
-
-    with open(
-        script_dir / "ElectionResultCentral2079.json", "r", encoding="utf-8"
-    ) as f:
-        central_data = json.load(f)
-
-    with open(script_dir / "ElectionResultState2079.json", "r", encoding="utf-8") as f:
-        state_data = json.load(f)
+    central_data = orjson.loads(
+        (script_dir / "ElectionResultCentral2079.json").read_bytes()
+    )
+    state_data = orjson.loads(
+        (script_dir / "ElectionResultState2079.json").read_bytes()
+    )
 
     all_candidates = central_data + state_data
     print(f"Found {len(all_candidates)} candidates to translate")
@@ -132,28 +187,56 @@ async def main():
     output_file = script_dir / "translations.json"
     translations = {}
     if output_file.exists():
-        with open(output_file, "r", encoding="utf-8") as f:
-            translations = json.load(f)
+        translations = orjson.loads(output_file.read_bytes())
         print(f"Loaded {len(translations)} existing translations")
 
-    # Translate each candidate
-    for i, candidate in enumerate(all_candidates, 1):
-        candidate_id = str(candidate["CandidateID"])
+    # Recover translations made since the last fold into translations.json
+    checkpoint_file = script_dir / "translations.ndjson"
+    replayed = replay_checkpoint(checkpoint_file, translations)
+    if replayed:
+        print(f"Replayed {replayed} translations from {checkpoint_file.name}")
+        save_translations(output_file, translations)
+        checkpoint_file.unlink()
+
+    # Translate candidates in concurrent chunks, appending each result to the
+    # NDJSON checkpoint and folding it into translations.json every
+    # CHECKPOINT_INTERVAL entries
+    remaining = [c for c in all_candidates if str(c["CandidateID"]) not in translations]
+    print(
+        f"Skipping {len(all_candidates) - len(remaining)} already translated candidates"
+    )
 
-        if candidate_id in translations:
+    sem = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+    pending = 0
+    with open(checkpoint_file, "a", encoding="utf-8") as checkpoint:
+        for start in range(0, len(remaining), CHUNK_SIZE):
+            chunk = remaining[start : start + CHUNK_SIZE]
             print(
-                f"[{i}/{len(all_candidates)}] Skipping (already translated): {candidate['CandidateName']}"
+                f"[{start + len(chunk)}/{len(remaining)}] Translating {len(chunk)} candidates..."
+            )
+            results = await asyncio.gather(
+                *(_translate(sem, provider, candidate) for candidate in chunk)
             )
-            continue
-
-        print(f"[{i}/{len(all_candidates)}] Translating: {candidate['CandidateName']}")
-        translated = await translate_candidate(provider, candidate)
-        translations[candidate_id] = translated
-        print(f"  ✓ {translated.get('name', 'N/A')}")
 
-        # Save after each translation
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(translations, f, ensure_ascii=False, indent=2)
+            for candidate, translated in zip(chunk, results):
+                if translated is None:
+                    continue
+                candidate_id = str(candidate["CandidateID"])
+                translations[candidate_id] = translated
+                print(f"  ✓ {translated.get('name', 'N/A')}")
+                checkpoint.write(
+                    json.dumps({candidate_id: translated}, ensure_ascii=False) + "\n"
+                )
+                pending += 1
+
+            checkpoint.flush()
+            if pending >= CHECKPOINT_INTERVAL:
+                save_translations(output_file, translations)
+                checkpoint.truncate(0)
+                pending = 0
+
+    save_translations(output_file, translations)
+    checkpoint_file.unlink()
 
     print(f"\n✓ Completed: {len(translations)} translations in {output_file}")
 
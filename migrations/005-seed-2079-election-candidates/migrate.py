@@ -5,34 +5,23 @@ Author: Damodar Dahal
 Date: 2025-11-09
 """
 
+import functools
+import os
+import pickle
+import re
+import sys
+from collections import Counter
 from datetime import date
+from itertools import chain, islice
+from pathlib import Path
 
 from nepali_date_utils import converter
 
 from nes.core.identifiers.builders import break_entity_id, build_entity_id
-from nes.core.models import (
-    Address,
-    Attribution,
-    EntityPicture,
-    EntityPictureType,
-    LangText,
-    LangTextValue,
-    Name,
-    NameParts,
-)
-from nes.core.models.entity import EntitySubType, EntityType, ExternalIdentifier
+from nes.core.models import Attribution, EntityPictureType, LangText, LangTextValue
+from nes.core.models.entity import EntitySubType, EntityType
 from nes.core.models.location import LocationType
-from nes.core.models.person import (
-    Candidacy,
-    Education,
-    ElectionPosition,
-    ElectionSymbol,
-    ElectionType,
-    ElectoralDetails,
-    Gender,
-    PersonDetails,
-    Position,
-)
+from nes.core.models.person import ElectionPosition, ElectionType, Gender
 from nes.core.models.version import Author
 from nes.core.utils.slug_helper import text_to_slug
 from nes.services.migration.context import MigrationContext
@@ -43,6 +32,36 @@ DATE = "2025-11-12"
 DESCRIPTION = "Import 2079 election candidates as Person entities"
 CHANGE_DESCRIPTION = "Initial sourcing from 2079 election results"
 
+# Number of person entities written per bulk create call
+BULK_BATCH_SIZE = 500
+
+# Progress is logged once per this many created persons
+LOG_INTERVAL = 100
+
+_DOT_RUN_RE = re.compile(r"\.{2,}")
+
+# Interned keys of the raw candidate rows read on every candidate
+_K_PARTY = sys.intern("PoliticalPartyName")
+_K_DISTRICT = sys.intern("DistrictName")
+_K_CENTRAL = sys.intern("central")
+_K_SC = sys.intern("SCConstID")
+_K_CC = sys.intern("CenterConstID")
+
+# Opt-in on-disk cache of the party/district/constituency lookups, for
+# re-running this migration during development (NES_MIGRATION_CACHE=1)
+LOOKUP_CACHE_PATH = Path.home() / ".cache" / "nes-migration-005.pkl"
+LOOKUP_CACHE_VERSION = "v1"
+
+# Entity directories the lookups are built from; their file counts and
+# latest mtimes are part of the cache key
+LOOKUP_SOURCES = (
+    (EntityType.ORGANIZATION.value, EntitySubType.POLITICAL_PARTY.value),
+    (EntityType.LOCATION.value, EntitySubType.DISTRICT.value),
+    (EntityType.LOCATION.value, EntitySubType.CONSTITUENCY.value),
+)
+
+_GENDER_MAP = {"पुरुष": Gender.MALE, "महिला": Gender.FEMALE}
+
 # CSV to database district name mapping
 DISTRICT_NAME_MAP = {
     "अर्घाखांची": "arghakhanchi",
@@ -99,15 +118,57 @@ PARTY_ADDITIONAL_NAME_MAP = {
 }
 
 
+def _mk_lang_text(
+    en: str | None,
+    ne: str | None,
+    en_provenance: str = "translation_service",
+    ne_provenance: str = "imported",
+) -> dict:
+    """Build a LangText-shaped dict; validation happens at entity creation."""
+    return {
+        "en": {"value": en, "provenance": en_provenance} if en else None,
+        "ne": {"value": ne, "provenance": ne_provenance} if ne else None,
+    }
+
+
+@functools.lru_cache(maxsize=4096)
+def _bs_to_ad_cached(year: int, month: int, day: int) -> date | None:
+    """Convert a BS date to AD; birth dates repeat heavily across candidates."""
+    try:
+        date_ad = converter.bs_to_ad(f"{year:04d}/{month:02d}/{day:02d}")
+        y, m, d = date_ad.split("/")
+        return date(int(y), int(m), int(d))
+    except Exception:
+        return None
+
+
 class CandidateMigration:
     def __init__(self, context: MigrationContext):
         self.context = context
         self.name_extractor = NameExtractor()
+        # Party and relative names repeat across thousands of candidates
+        self._std_name = functools.lru_cache(maxsize=8192)(
+            self.name_extractor.standardize_name
+        )
         self.author_id = None
         self.candidate_lookup = {}  # CandidateID -> raw candidate data
         self.party_lookup = {}  # Standardized party name -> entity ID
         self.district_id_map = {}  # District name (Nepali) -> entity ID
+        self._district_id_set = set()  # Known district entity IDs
+        self._district_ne_to_id = {}  # Direct or mapped district name -> entity ID
+        self._party_id_cache: dict[str, str] = {}  # Raw party name -> ID
+        self._constituency_cache: dict[tuple, str] = {}  # Raw CSV fields -> ID
+        # CSV party name -> standardized database party name
+        self._party_map_standardized = {
+            k: self._std_name(v) for k, v in PARTY_ADDITIONAL_NAME_MAP.items()
+        }
         self.constituency_map = {}  # constituency entity ID -> Location entity
+        # Identical for every candidate, so built (and validated) only once
+        self._shared_attribution = self._build_attribution()
+        self._identifier_name = LangText(
+            en=LangTextValue(value="nec_candidate_id", provenance="human"),
+            ne=LangTextValue(value="निर्वाचन आयोग दर्ता नं०", provenance="human"),
+        )
 
     async def run(self):
         self.context.log("Migration started: Importing 2079 election candidates")
@@ -121,12 +182,17 @@ class CandidateMigration:
 
     async def _identify_missing_parties(self):
         """Identify all party names that cannot be resolved."""
-        missing_parties = set()
-        for candidate_id, raw in self.candidate_lookup.items():
-            party_name = raw.get("PoliticalPartyName", "")
+        # Resolve each distinct name once; _get_party_id caches the result
+        unique_parties = set()
+        for raw in self.candidate_lookup.values():
+            party_name = raw.get(_K_PARTY, "")
             if party_name and party_name != "स्वतन्त्र":
-                if self._get_party_id(party_name, collect_missing=True) is None:
-                    missing_parties.add(party_name)
+                unique_parties.add(party_name)
+        missing_parties = {
+            p
+            for p in unique_parties
+            if self._get_party_id(p, collect_missing=True) is None
+        }
 
         if missing_parties:
             self.context.log("\n=== MISSING PARTIES ===")
@@ -152,29 +218,61 @@ class CandidateMigration:
         central_data = self.context.read_json("source/ElectionResultCentral2079.json")
         state_data = self.context.read_json("source/ElectionResultState2079.json")
         for row in central_data:
-            row["central"] = True
+            row[_K_CENTRAL] = True
 
-        all_candidates = central_data + state_data
-        self.candidate_lookup = {c["CandidateID"]: c for c in all_candidates}
+        # Re-key rows with interned strings so lookups hit the identity fast path
+        self.candidate_lookup = {
+            c["CandidateID"]: {sys.intern(k): v for k, v in c.items()}
+            for c in chain(central_data, state_data)
+        }
         self.context.log(
-            f"Loaded {len(all_candidates)} candidates from election results"
+            f"Loaded {len(central_data) + len(state_data)} candidates from election results"
         )
 
         return candidate_translations
 
     async def _build_lookups(self):
-        parties = await self.context.db.list_entities(
-            entity_type="organization", sub_type="political_party", limit=1000
-        )
-        for party in parties:
-            for name in party.names:
-                if name.ne and name.ne.full:
-                    self.party_lookup[
-                        self.name_extractor.standardize_name(name.ne.full)
-                    ] = party.id
+        use_cache = os.getenv("NES_MIGRATION_CACHE") == "1"
+        cache_key = self._lookup_cache_key() if use_cache else None
+        cached = self._read_lookup_cache(cache_key) if cache_key else None
+        if cached is not None:
+            self.party_lookup, self.district_id_map, self.constituency_map = cached
+            self.context.log(f"Loaded lookups from cache {LOOKUP_CACHE_PATH}")
+        else:
+            await self._fetch_lookups()
+            if cache_key:
+                self._write_lookup_cache(cache_key)
+
         self.context.log(
             f"Loaded {len(self.party_lookup)} political parties for linking"
         )
+        self.context.log(
+            f"Loaded {len(self.constituency_map)} constituencies for linking"
+        )
+
+        self._district_id_set = set(self.district_id_map.values())
+
+        # Resolve CSV spellings through DISTRICT_NAME_MAP up front; names that
+        # match the database directly take precedence.
+        self._district_ne_to_id = {}
+        for district_name_ne, district_slug in DISTRICT_NAME_MAP.items():
+            district_id = build_entity_id(
+                type="location", subtype=LocationType.DISTRICT.value, slug=district_slug
+            )
+            if district_id in self._district_id_set:
+                self._district_ne_to_id[district_name_ne] = district_id
+        self._district_ne_to_id.update(self.district_id_map)
+
+    async def _fetch_lookups(self):
+        parties = await self.context.db.list_entities(
+            entity_type="organization", sub_type="political_party", limit=1000
+        )
+        self.party_lookup = {
+            self._std_name(name.ne.full): party.id
+            for party in parties
+            for name in party.names
+            if name.ne and name.ne.full
+        }
 
         districts = await self.context.search.search_entities(
             entity_type=EntityType.LOCATION, sub_type=EntitySubType.DISTRICT, limit=77
@@ -188,53 +286,96 @@ class CandidateMigration:
         )
         for c in constituencies:
             self.constituency_map[c.id] = c
-        self.context.log(
-            f"Loaded {len(self.constituency_map)} constituencies for linking"
-        )
+
+    def _lookup_cache_key(self) -> tuple | None:
+        # Only a file database can be fingerprinted; others never use the cache
+        base_path = getattr(self.context.db, "base_path", None)
+        if base_path is None:
+            return None
+
+        signature = []
+        for entity_type, sub_type in LOOKUP_SOURCES:
+            source_dir = Path(base_path) / "entity" / entity_type / sub_type
+            count = 0
+            latest = source_dir.stat().st_mtime_ns if source_dir.exists() else 0
+            for entity_file in source_dir.rglob("*.json"):
+                count += 1
+                latest = max(latest, entity_file.stat().st_mtime_ns)
+            signature.append((entity_type, sub_type, count, latest))
+
+        return (LOOKUP_CACHE_VERSION, str(base_path), *signature)
+
+    def _read_lookup_cache(self, cache_key: tuple) -> tuple | None:
+        try:
+            with open(LOOKUP_CACHE_PATH, "rb") as f:
+                cached = pickle.load(f)
+            if cached["key"] != cache_key:
+                return None
+            party_lookup, district_id_map, constituency_map = cached["lookups"]
+        except Exception:
+            # A missing, corrupt or outdated cache file is just a cache miss
+            return None
+        return party_lookup, district_id_map, constituency_map
+
+    def _write_lookup_cache(self, cache_key: tuple):
+        LOOKUP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(LOOKUP_CACHE_PATH, "wb") as f:
+            pickle.dump(
+                {
+                    "key": cache_key,
+                    "lookups": (
+                        self.party_lookup,
+                        self.district_id_map,
+                        self.constituency_map,
+                    ),
+                },
+                f,
+            )
 
     def _get_party_id(
         self, party_name: str, collect_missing: bool = False
     ) -> str | None:
         if party_name == "स्वतन्त्र":
             return None
+        cached = self._party_id_cache.get(party_name)
+        if cached is not None:
+            return cached
         original_name = party_name
         party_name = party_name.replace("(एकल चुनाव चिन्ह)", "")
 
         # Try mapping first
-        if party_name in PARTY_ADDITIONAL_NAME_MAP:
-            party_name = PARTY_ADDITIONAL_NAME_MAP[party_name]
-
-        party_name = self.name_extractor.standardize_name(party_name)
+        mapped = self._party_map_standardized.get(party_name)
+        party_name = mapped if mapped is not None else self._std_name(party_name)
         if party_name not in self.party_lookup:
             if collect_missing:
                 return None
             raise Exception(
                 f"No political party found for {party_name} (original: {original_name})"
             )
-        return self.party_lookup[party_name]
+        party_id = self._party_id_cache[original_name] = self.party_lookup[party_name]
+        return party_id
 
     def _get_district_id(self, district_name_ne: str) -> str:
-        if district_name_ne in self.district_id_map:
-            return self.district_id_map[district_name_ne]
-
-        # Try using the mapping
-        if district_name_ne in DISTRICT_NAME_MAP:
-            district_slug = DISTRICT_NAME_MAP[district_name_ne]
-            district_id = build_entity_id(
-                type="location", subtype=LocationType.DISTRICT.value, slug=district_slug
-            )
-            if district_id in [d_id for d_id in self.district_id_map.values()]:
-                return district_id
-
-        raise Exception(f"District {district_name_ne} not found")
+        try:
+            return self._district_ne_to_id[district_name_ne]
+        except KeyError:
+            raise Exception(f"District {district_name_ne} not found") from None
 
     def _get_constituency_id(self, raw: dict) -> str:
-        district_id = self._get_district_id(raw["DistrictName"])
+        key = (
+            raw[_K_DISTRICT],
+            raw.get(_K_SC),
+            raw.get(_K_CC),
+            raw.get(_K_CENTRAL),
+        )
+        cached = self._constituency_cache.get(key)
+        if cached is not None:
+            return cached
+
+        district_id = self._get_district_id(raw[_K_DISTRICT])
         district_slug = break_entity_id(district_id).slug
 
-        constituency_number = (
-            raw["SCConstID"] if raw.get("central") else raw["CenterConstID"]
-        )
+        constituency_number = raw[_K_SC] if raw.get(_K_CENTRAL) else raw[_K_CC]
 
         entity_id = build_entity_id(
             type="location",
@@ -244,10 +385,11 @@ class CandidateMigration:
 
         assert entity_id in self.constituency_map
 
+        self._constituency_cache[key] = entity_id
         return entity_id
 
     async def _process_candidates(self, candidate_translations: dict):
-        # Build list of all person data
+        # Building a payload is pure CPU work, so build them in a plain loop
         person_data_list = []
         for candidate_id, translated in candidate_translations.items():
             candidate_id = int(candidate_id)
@@ -258,14 +400,15 @@ class CandidateMigration:
                 )
                 continue
 
-            person_data = await self._build_person_data(candidate_id, raw, translated)
-            person_data_list.append(person_data)
+            person_data_list.append(
+                self._build_person_data(candidate_id, raw, translated)
+            )
 
         self.context.log(f"Built {len(person_data_list)} person entities")
 
         # Fix duplicate slugs by adding candidate ID suffix
-        slugs = [p["slug"] for p in person_data_list]
-        duplicate_slugs = [s for s in set(slugs) if slugs.count(s) > 1]
+        slug_counts = Counter(p["slug"] for p in person_data_list)
+        duplicate_slugs = {s for s, c in slug_counts.items() if c > 1}
         if duplicate_slugs:
             self.context.log(
                 f"Found {len(duplicate_slugs)} duplicate slugs, adding candidate ID suffix"
@@ -276,28 +419,35 @@ class CandidateMigration:
                         f"{person_data['slug']}-{person_data['candidate_id']}"
                     )
 
-        # Create entities in DB one by one
         for person_data in person_data_list:
             del person_data["candidate_id"]
 
-            person = await self.context.publication.create_entity(
+        # Create entities in DB in bulk batches
+        created = []
+        remaining = iter(person_data_list)
+        while batch := list(islice(remaining, BULK_BATCH_SIZE)):
+            persons = await self.context.publication.create_entities_bulk(
                 entity_type=EntityType.PERSON,
-                entity_subtype=None,
-                entity_data=person_data,
+                entities_data=batch,
                 author_id=self.author_id,
                 change_description=CHANGE_DESCRIPTION,
             )
-            self.context.log(f"Created person {person.id}")
+            for person in persons:
+                created.append(person.id)
+                if len(created) % LOG_INTERVAL == 0:
+                    self.context.log(
+                        f"Created {len(created)} persons; last id={created[-1]}"
+                    )
 
         self.context.log(f"Created {len(person_data_list)} person entities")
 
-    async def _build_person_data(
+    def _build_person_data(
         self, candidate_id: int, raw: dict, translated: dict
     ) -> dict:
         personal_details = self._build_personal_details(raw, translated)
         electoral_details = self._build_electoral_details(candidate_id, raw, translated)
         attributes = self._build_attributes(raw, translated)
-        tags = self._build_tags(raw, electoral_details.candidacies[0])
+        tags = self._build_tags(raw, electoral_details["candidacies"][0])
 
         slug = text_to_slug(translated["name"])
         # Special case: For candidate ID 333804, named BP koirala, include candidate ID in slug
@@ -310,31 +460,27 @@ class CandidateMigration:
             candidate_id=candidate_id,
             tags=tags,
             names=[
-                Name(
-                    kind="PRIMARY",
-                    en=NameParts(
-                        full=self.name_extractor.standardize_name(translated["name"])
-                    ),
-                    ne=NameParts(
-                        full=self.name_extractor.standardize_name(raw["CandidateName"])
-                    ),
-                ).model_dump()
+                {
+                    "kind": "PRIMARY",
+                    "en": {"full": self._std_name(translated["name"])},
+                    "ne": {"full": self._std_name(raw["CandidateName"])},
+                }
             ],
             attributes=attributes,
-            attributions=[self._build_attribution()],
-            personal_details=personal_details.model_dump(),
+            attributions=[self._shared_attribution],
+            personal_details=personal_details,
             identifiers=[self._build_identifier(candidate_id)],
-            electoral_details=electoral_details.model_dump(),
+            electoral_details=electoral_details,
             pictures=[self._build_picture(candidate_id)],
         )
 
-    def _build_personal_details(self, raw: dict, translated: dict) -> PersonDetails:
+    def _build_personal_details(self, raw: dict, translated: dict) -> dict:
         birth_date = self._parse_dob(raw.get("DOB"))
 
         citizenship_place = None
         if raw.get("CTZDIST"):
             citizenship_district = self._get_district_id(raw.get("CTZDIST"))
-            citizenship_place = Address(location_id=citizenship_district)
+            citizenship_place = {"location_id": citizenship_district}
 
         father_en = self._clean_attr(translated.get("father_name"))
         father_ne = self._clean_attr(raw.get("FATHER_NAME"))
@@ -346,73 +492,64 @@ class CandidateMigration:
         education = self._build_education(raw, translated)
         positions = self._build_positions(raw, translated)
 
-        return PersonDetails(
-            birth_date=str(birth_date),
-            gender=self._parse_gender(raw.get("Gender", "")),
-            father_name=(
+        return {
+            "birth_date": str(birth_date),
+            "gender": self._parse_gender(raw.get("Gender", "")),
+            "father_name": (
                 self._build_lang_text(father_en, father_ne, standardize=True)
                 if father_en or father_ne
                 else None
             ),
-            citizenship_place=citizenship_place,
-            spouse_name=(
+            "citizenship_place": citizenship_place,
+            "spouse_name": (
                 self._build_lang_text(spouse_en, spouse_ne, standardize=True)
                 if spouse_en or spouse_ne
                 else None
             ),
-            address=Address(description2=self._build_lang_text(addr_en, addr_ne)),
-            education=education if education else None,
-            positions=positions if positions else None,
-        )
+            "address": {"description2": self._build_lang_text(addr_en, addr_ne)},
+            "education": education if education else None,
+            "positions": positions if positions else None,
+        }
 
     def _build_electoral_details(
         self, candidate_id: int, raw: dict, translated: dict
-    ) -> ElectoralDetails:
-        party_id = self._get_party_id(
-            raw.get("PoliticalPartyName", ""), collect_missing=False
-        )
+    ) -> dict:
+        party_id = self._get_party_id(raw.get(_K_PARTY, ""), collect_missing=False)
         constituency_id = self._get_constituency_id(raw)
         symbol = self._build_symbol(raw, translated)
 
         pa_subdivision = None
-        if not raw.get("central"):
-            pa_subdivision = "A" if raw.get("SCConstID") == 1 else "B"
+        if not raw.get(_K_CENTRAL):
+            pa_subdivision = "A" if raw.get(_K_SC) == 1 else "B"
 
-        candidacy = Candidacy(
-            election_year=2079,
-            election_type=(
-                ElectionType.FEDERAL if raw.get("central") else ElectionType.PROVINCIAL
+        candidacy = {
+            "election_year": 2079,
+            "election_type": (
+                ElectionType.FEDERAL if raw.get(_K_CENTRAL) else ElectionType.PROVINCIAL
             ),
-            constituency_id=constituency_id,
-            pa_subdivision=pa_subdivision,
-            position=(
+            "constituency_id": constituency_id,
+            "pa_subdivision": pa_subdivision,
+            "position": (
                 ElectionPosition.FEDERAL_PARLIAMENT
-                if raw.get("central")
+                if raw.get(_K_CENTRAL)
                 else ElectionPosition.PROVINCIAL_ASSEMBLY
             ),
-            candidate_id=candidate_id,
-            party_id=party_id,
-            votes_received=raw.get("TotalVoteReceived"),
-            elected=raw.get("Remarks") == "Elected",
-            symbol=symbol,
-        )
-        return ElectoralDetails(candidacies=[candidacy])
+            "candidate_id": candidate_id,
+            "party_id": party_id,
+            "votes_received": raw.get("TotalVoteReceived"),
+            "elected": raw.get("Remarks") == "Elected",
+            "symbol": symbol,
+        }
+        return {"candidacies": [candidacy]}
 
-    def _build_symbol(self, raw: dict, translated: dict) -> ElectionSymbol | None:
+    def _build_symbol(self, raw: dict, translated: dict) -> dict | None:
         if not (raw.get("SymbolID") and raw.get("SymbolName")):
             return None
         symbol_en = self._clean_attr(translated.get("symbol_name"))
-        return ElectionSymbol(
-            symbol_name=LangText(
-                en=(
-                    LangTextValue(value=symbol_en, provenance="translation_service")
-                    if symbol_en
-                    else None
-                ),
-                ne=LangTextValue(value=raw["SymbolName"], provenance="imported"),
-            ),
-            nec_id=int(raw["SymbolID"]),
-        )
+        return {
+            "symbol_name": _mk_lang_text(symbol_en, raw["SymbolName"]),
+            "nec_id": int(raw["SymbolID"]),
+        }
 
     def _build_attributes(self, raw: dict, translated: dict) -> dict:
         inst_en = self._clean_attr(translated.get("institution"))
@@ -442,15 +579,15 @@ class CandidateMigration:
             }
         }
 
-    def _build_tags(self, raw: dict, candidacy: Candidacy) -> list[str]:
+    def _build_tags(self, raw: dict, candidacy: dict) -> list[str]:
         tags = []
-        if raw.get("central"):
+        if raw.get(_K_CENTRAL):
             tags.append("federal-election-2079-candidate")
-            if candidacy.elected:
+            if candidacy["elected"]:
                 tags.append("federal-election-2079-elected")
         else:
             tags.append("provincial-election-2079-candidate")
-            if candidacy.elected:
+            if candidacy["elected"]:
                 tags.append("provincial-election-2079-elected")
         return tags
 
@@ -475,24 +612,21 @@ class CandidateMigration:
             ),
         )
 
-    def _build_identifier(self, candidate_id: int) -> ExternalIdentifier:
-        return ExternalIdentifier(
-            scheme="other",
-            name=LangText(
-                en=LangTextValue(value="nec_candidate_id", provenance="human"),
-                ne=LangTextValue(value="निर्वाचन आयोग दर्ता नं०", provenance="human"),
-            ),
-            value=str(candidate_id),
-        )
+    def _build_identifier(self, candidate_id: int) -> dict:
+        return {
+            "scheme": "other",
+            "name": self._identifier_name,
+            "value": str(candidate_id),
+        }
 
-    def _build_picture(self, candidate_id: int) -> EntityPicture:
-        return EntityPicture(
-            type=EntityPictureType.THUMB,
-            url=f"https://assets.nes.newnepal.org/assets/images/election-commission-2079-pictures/{candidate_id}.jpg",
-            description="Source: Nepal Election Commission",
-        )
+    def _build_picture(self, candidate_id: int) -> dict:
+        return {
+            "type": EntityPictureType.THUMB,
+            "url": f"https://assets.nes.newnepal.org/assets/images/election-commission-2079-pictures/{candidate_id}.jpg",
+            "description": "Source: Nepal Election Commission",
+        }
 
-    def _build_education(self, raw: dict, translated: dict) -> list[Education] | None:
+    def _build_education(self, raw: dict, translated: dict) -> list[dict] | None:
         inst_en = self._clean_attr(translated.get("education_institution"))
         inst_ne = self._clean_attr(raw.get("NAMEOFINST"))
         degree_en = self._clean_attr(translated.get("education_level"))
@@ -502,26 +636,22 @@ class CandidateMigration:
             return None
 
         return [
-            Education(
-                institution=(
-                    self._build_lang_text(inst_en, inst_ne)
-                    if inst_en or inst_ne
-                    else LangText()
-                ),
-                degree=(
+            {
+                "institution": self._build_lang_text(inst_en, inst_ne),
+                "degree": (
                     self._build_lang_text(degree_en, None, en_provenance="llm")
                     if degree_en
                     else None
                 ),
-                field=(
+                "field": (
                     self._build_lang_text(field_en, None, en_provenance="llm")
                     if field_en
                     else None
                 ),
-            )
+            }
         ]
 
-    def _build_positions(self, raw: dict, translated: dict) -> list[Position] | None:
+    def _build_positions(self, raw: dict, translated: dict) -> list[dict] | None:
         title_en = self._clean_attr(translated.get("position_title"))
         org_en = self._clean_attr(translated.get("organization"))
         desc_en = self._clean_attr(translated.get("description"))
@@ -530,19 +660,15 @@ class CandidateMigration:
             return None
 
         return [
-            Position(
-                title=(
-                    self._build_lang_text(title_en, None, en_provenance="llm")
-                    if title_en
-                    else LangText()
-                ),
-                organization=(
+            {
+                "title": self._build_lang_text(title_en, None, en_provenance="llm"),
+                "organization": (
                     self._build_lang_text(org_en, None, en_provenance="llm")
                     if org_en
                     else None
                 ),
-                description=desc_en[:200] if desc_en else None,
-            )
+                "description": desc_en[:200] if desc_en else None,
+            }
         ]
 
     def _build_lang_text(
@@ -552,22 +678,11 @@ class CandidateMigration:
         standardize: bool = False,
         en_provenance="translation_service",
         ne_provenance="imported",
-    ) -> LangText:
+    ) -> dict:
         if standardize:
-            en_val = self.name_extractor.standardize_name(en_val) if en_val else None
-            ne_val = self.name_extractor.standardize_name(ne_val) if ne_val else None
-        return LangText(
-            en=(
-                LangTextValue(value=en_val, provenance=en_provenance)
-                if en_val
-                else None
-            ),
-            ne=(
-                LangTextValue(value=ne_val, provenance=ne_provenance)
-                if ne_val
-                else None
-            ),
-        )
+            en_val = self._std_name(en_val) if en_val else None
+            ne_val = self._std_name(ne_val) if ne_val else None
+        return _mk_lang_text(en_val, ne_val, en_provenance, ne_provenance)
 
     @staticmethod
     def _clean_attr(attr: str) -> str | None:
@@ -576,10 +691,8 @@ class CandidateMigration:
         attr = attr.strip()
         if attr == "0" or attr.lower() == "n/a" or attr == "-":
             return None
-        # Remove excessive dots (4 or more consecutive dots)
-        import re
-
-        attr = re.sub(r"\.{2,}", "", attr)
+        # Remove runs of two or more consecutive dots
+        attr = _DOT_RUN_RE.sub("", attr)
         attr = attr.strip()
         if not attr:
             return None
@@ -587,24 +700,20 @@ class CandidateMigration:
 
     @staticmethod
     def _parse_gender(gender_str: str) -> Gender:
-        gender_map = {"पुरुष": Gender.MALE, "महिला": Gender.FEMALE}
-        return gender_map.get(gender_str, Gender.OTHER)
+        return _GENDER_MAP.get(gender_str, Gender.OTHER)
 
     @staticmethod
     def _parse_dob(dob_str: str) -> date | None:
         if not dob_str:
             return None
+        parts = dob_str.replace("/", ".").split(".")
+        if len(parts) != 3:
+            return None
         try:
-            parts = dob_str.replace("/", ".").split(".")
-            if len(parts) != 3:
-                return None
-            year, month, day = parts[0].zfill(4), parts[1].zfill(2), parts[2].zfill(2)
-            date_bs = f"{year}/{month}/{day}"
-            date_ad = converter.bs_to_ad(date_bs)
-            y, m, d = date_ad.split("/")
-            return date(int(y), int(m), int(d))
-        except Exception:
+            year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
+        except ValueError:
             return None
+        return _bs_to_ad_cached(year, month, day)
 
     async def _verify(self):
         entities = await self.context.db.list_entities(
@@ -5,20 +5,14 @@ Author: Subash Rijal
 Date: 2025-01-23
 """
 
+import functools
 from datetime import datetime, timezone
-from typing import Dict
-
-from nes.core.models import (
-    Address,
-    Attribution,
-    ExternalIdentifier,
-    LangText,
-    LangTextValue,
-    Name,
-    NameParts,
-)
+from typing import Any, Dict, NamedTuple, Optional
+
+from nes.core.models import Attribution, LangText, LangTextValue
 from nes.core.models.base import NameKind
 from nes.core.models.entity import EntitySubType, EntityType
+from nes.core.models.organization import OwnershipType
 from nes.core.models.version import Author
 from nes.core.utils.slug_helper import text_to_slug
 from nes.services.migration.context import MigrationContext
@@ -29,9 +23,104 @@ AUTHOR = "Subash Rijal"
 DATE = "2025-01-23"
 DESCRIPTION = "Import hospitals from nhfr.mohp.gov.np"
 CHANGE_DESCRIPTION = "Initial sourcing from nhfr.mohp.gov.np"
+AUTHOR_SLUG = text_to_slug(AUTHOR)
+
+# Number of hospital entities written per bulk create call
+BULK_BATCH_SIZE = 500
 
 name_extractor = NameExtractor()
 
+# text_to_slug is pure; generic facility names repeat across the registry
+_slug = functools.lru_cache(maxsize=8192)(text_to_slug)
+
+# Ownership keywords in priority order; the first one found in the
+# lowercased ownership name decides the type
+OWNERSHIP_KEYWORDS = (
+    ("government", OwnershipType.GOVERNMENT),
+    ("govt", OwnershipType.GOVERNMENT),
+    ("state", OwnershipType.GOVERNMENT),
+    ("public", OwnershipType.PUBLIC),
+    ("municipal", OwnershipType.PUBLIC),
+    ("community", OwnershipType.PUBLIC),
+    ("private", OwnershipType.PRIVATE),
+)
+
+# Identifier names shared by every hospital
+HF_CODE_IDENTIFIER_NAME = LangText(
+    en=LangTextValue(value="NHFR Facility Code", provenance="human"),
+)
+HF_ID_IDENTIFIER_NAME = LangText(
+    en=LangTextValue(value="NHFR ID", provenance="human"),
+)
+
+
+class HospitalRow(NamedTuple):
+    """The NHFR record fields used by the import, flattened and cleaned."""
+
+    name_en: str
+    name_ne: str
+    hf_code: Any
+    hf_id: Any
+    ward: Any
+    district_name: str
+    municipality_name: str
+    province_name: str
+    facility_type: str
+    facility_level: str
+    ownership: str
+    beds: Optional[int]
+    contact_person: Any
+    contact_mobile: Any
+    latitude: Any
+    longitude: Any
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _extract(h: dict) -> HospitalRow:
+    """Read every field the import needs from one NHFR record in a single pass."""
+    get = h.get
+    district = get("districts") or {}
+    municipality = get("municipalitys") or {}
+    province = get("provinces") or {}
+    facility_type = get("healthFacilityType") or {}
+    facility_level = get("healthFacilityLevel") or {}
+    ownerships = get("ownerships") or {}
+
+    # Functional beds take precedence over sanctioned ones
+    beds_functional = get("functional")
+    beds_sectioned = get("sectioned")
+    if beds_functional:
+        beds = _to_int(beds_functional)
+    elif beds_sectioned:
+        beds = _to_int(beds_sectioned)
+    else:
+        beds = None
+
+    return HospitalRow(
+        name_en=(get("hf_name") or "").strip(),
+        name_ne=(get("c_hf_name") or "").strip(),
+        hf_code=get("hf_code"),
+        hf_id=get("id"),
+        ward=get("ward", ""),
+        district_name=(district.get("nameen", "") or "").strip(),
+        municipality_name=(municipality.get("nameen", "") or "").strip(),
+        province_name=(province.get("nameen", "") or "").strip(),
+        facility_type=facility_type.get("type_name", "Unknown"),
+        facility_level=facility_level.get("name", ""),
+        ownership=ownerships.get("name", "Unknown"),
+        beds=beds,
+        contact_person=get("contact_person", ""),
+        contact_mobile=get("contact_person_mobile", ""),
+        latitude=get("latitude", ""),
+        longitude=get("longitude", ""),
+    )
+
 
 def _normalize_location_name(name: str) -> str:
     s = (name or "").strip().lower()
@@ -90,7 +179,7 @@ async def migrate(context: MigrationContext) -> None:
     context.log("Migration started: Importing hospitals from nhfr.mohp.gov.np")
 
     # Create author
-    author = Author(slug=text_to_slug(AUTHOR), name=AUTHOR)
+    author = Author(slug=AUTHOR_SLUG, name=AUTHOR)
     await context.db.put_author(author)
     author_id = author.id
     context.log(f"Created author: {author.name} ({author_id})")
@@ -143,55 +232,29 @@ async def migrate(context: MigrationContext) -> None:
         )
     ]
 
-    locations = await context.search.search_entities(
-        entity_type="location", limit=10_000
-    )
-    location_lookup: Dict[str, object] = {}
     province_lookup: Dict[str, object] = {}
     district_lookup: Dict[str, object] = {}
     municipality_lookup: Dict[str, object] = {}
-
-    for loc in locations:
-        st = loc.sub_type.value if loc.sub_type else None
-        for nm in loc.names:
-            if nm.en and nm.en.full:
-                key_full = nm.en.full.strip().lower()
-                key_norm = _normalize_location_name(nm.en.full)
-                location_lookup[key_full] = loc
-                location_lookup[key_norm] = loc
-                if st == "province":
-                    province_lookup[key_full] = loc
-                    province_lookup[key_norm] = loc
-                elif st == "district":
-                    district_lookup[key_full] = loc
-                    district_lookup[key_norm] = loc
-                elif st in [
-                    "metropolitan_city",
-                    "sub_metropolitan_city",
-                    "municipality",
-                    "rural_municipality",
-                ]:
-                    municipality_lookup[key_full] = loc
-                    municipality_lookup[key_norm] = loc
-            if nm.ne and nm.ne.full:
-                key_ne = nm.ne.full.strip().lower()
-                key_ne_norm = _normalize_location_name(nm.ne.full)
-                location_lookup[key_ne] = loc
-                location_lookup[key_ne_norm] = loc
-                if st == "province":
-                    province_lookup[key_ne] = loc
-                    province_lookup[key_ne_norm] = loc
-                elif st == "district":
-                    district_lookup[key_ne] = loc
-                    district_lookup[key_ne_norm] = loc
-                elif st in [
-                    "metropolitan_city",
-                    "sub_metropolitan_city",
-                    "municipality",
-                    "rural_municipality",
-                ]:
-                    municipality_lookup[key_ne] = loc
-                    municipality_lookup[key_ne_norm] = loc
+    lookup_by_sub_type = {
+        "province": province_lookup,
+        "district": district_lookup,
+        "metropolitan_city": municipality_lookup,
+        "municipality": municipality_lookup,
+        "rural_municipality": municipality_lookup,
+        "sub_metropolitan_city": municipality_lookup,
+    }
+
+    # One listing per needed sub type; wards and constituencies are never used
+    for st, lookup in lookup_by_sub_type.items():
+        locations = await context.db.list_entities(
+            limit=2000, entity_type="location", sub_type=st
+        )
+        for loc in locations:
+            for nm in loc.names:
+                for part in (nm.en, nm.ne):
+                    if part and part.full:
+                        lookup[part.full.strip().lower()] = loc
+                        lookup[_normalize_location_name(part.full)] = loc
 
     # Hospital data keys
     # 'id', 'hf_code', 'hf_name',
@@ -213,422 +276,326 @@ async def migrate(context: MigrationContext) -> None:
     #  'cbscode', 'reg_orgs', 'org_articles', 'vat_pans', 'org_perms', 'mem_citizenships', 'iee_certs', 'hf_details', 'service_fees',
     # 'building_maps', 'tax_clears'
 
-    try:
-        for hospital_data in hospitals:
-            # context.log(f"Hospital data keys: {hospital_data.keys()}")
-            # Extract basic information from NHFR data format
-            name_en = (hospital_data.get("hf_name") or "").strip()
-            if not name_en:
-                skipped_count += 1
-                continue
-
-            # Get facility details
-            hf_code = hospital_data.get("hf_code")
-            hf_id = hospital_data.get("id")
-
-            # Get Nepali name if available
-            name_ne = (hospital_data.get("c_hf_name") or "").strip()
-
-            # Extract location information
-            district_name = ""
-            municipality_name = ""
-            ward = hospital_data.get("ward", "")
-
-            if "districts" in hospital_data and hospital_data["districts"]:
-                district_name_raw = hospital_data["districts"].get("nameen", "")
-                district_name = district_name_raw.strip() if district_name_raw else ""
-
-            if "municipalitys" in hospital_data and hospital_data["municipalitys"]:
-                municipality_name_raw = hospital_data["municipalitys"].get("nameen", "")
-                municipality_name = (
-                    municipality_name_raw.strip() if municipality_name_raw else ""
-                )
-
-            province_name = ""
-            if "provinces" in hospital_data and hospital_data["provinces"]:
-                province_name_raw = hospital_data["provinces"].get("nameen", "")
-                province_name = province_name_raw.strip() if province_name_raw else ""
-
-            # Build location components
-            location_components = []
-            if municipality_name:
-                if ward:
-                    location_components.append(f"{municipality_name}, Ward {ward}")
-                else:
-                    location_components.append(municipality_name)
-            if district_name and district_name not in location_components:
-                location_components.append(district_name)
-            if province_name and province_name not in location_components:
-                location_components.append(province_name)
-
-            # Extract facility type and level
-            facility_type = "Unknown"
-            if (
-                "healthFacilityType" in hospital_data
-                and hospital_data["healthFacilityType"]
-            ):
-                facility_type = hospital_data["healthFacilityType"].get(
-                    "type_name", "Unknown"
-                )
-
-            facility_level = ""
-            if (
-                "healthFacilityLevel" in hospital_data
-                and hospital_data["healthFacilityLevel"]
-            ):
-                facility_level = hospital_data["healthFacilityLevel"].get("name", "")
-
-            # Extract ownership
-            ownership = "Unknown"
-            if "ownerships" in hospital_data and hospital_data["ownerships"]:
-                ownership = hospital_data["ownerships"].get("name", "Unknown")
-
-            # Extract bed information
-            beds_sectioned = hospital_data.get("sectioned")
-            beds_functional = hospital_data.get("functional")
-            beds = None
-            if beds_functional:
-                try:
-                    beds = int(beds_functional)
-                except (ValueError, TypeError):
-                    pass
-            elif beds_sectioned:
-                try:
-                    beds = int(beds_sectioned)
-                except (ValueError, TypeError):
-                    pass
-
-            # Extract contact information
-            contact_person = hospital_data.get("contact_person", "")
-            contact_mobile = hospital_data.get("contact_person_mobile", "")
-
-            # Extract coordinates
-            latitude = hospital_data.get("latitude", "")
-            longitude = hospital_data.get("longitude", "")
-
-            # Build address text
-            address_parts = []
-            if municipality_name:
-                if ward:
-                    address_parts.append(f"{municipality_name}, Ward {ward}")
-                else:
-                    address_parts.append(municipality_name)
-            if district_name:
-                address_parts.append(district_name)
-            if province_name:
-                address_parts.append(province_name)
-            address_text = ", ".join(address_parts)
-
-            # Use the primary location for linking (district or municipality)
-            location_name = district_name or municipality_name
-
-            # Normalize ownership
-            ownership_normalized = _normalize_ownership(ownership)
-
-            # Build names - ensure we always have at least English name
-            if not name_en:
-                context.log(f"WARNING: Hospital has no name, skipping")
-                continue
+    # The same few hundred location names repeat across thousands of
+    # hospitals, so each distinct name is resolved once
+    resolve_cache: Dict[tuple, object] = {}
+
+    def resolve_province(name: str):
+        key = ("province", name)
+        if key not in resolve_cache:
+            key_norm = _normalize_location_name(name)
+            key_norm = LOCATION_NAME_ALIASES.get(key_norm, key_norm)
+            key_full = name.strip().lower()
+            resolve_cache[key] = province_lookup.get(key_norm) or province_lookup.get(
+                key_full
+            )
+        return resolve_cache[key]
+
+    def resolve_location(name: str):
+        key = ("location", name)
+        if key not in resolve_cache:
+            key_norm = _normalize_location_name(name)
+            key_norm = LOCATION_NAME_ALIASES.get(key_norm, key_norm)
+            key_full = name.strip().lower()
+            resolve_cache[key] = (
+                district_lookup.get(key_norm)
+                or municipality_lookup.get(key_norm)
+                or district_lookup.get(key_full)
+                or municipality_lookup.get(key_full)
+            )
+        return resolve_cache[key]
 
-            name_en_clean = name_extractor.standardize_name(name_en)
-
-            names = [
-                Name(
-                    kind=NameKind.PRIMARY,
-                    en=NameParts(full=name_en_clean),
-                    ne=NameParts(full=name_ne) if name_ne else None,
-                ).model_dump()
-            ]
-
-            # Build identifiers (NHFR facility code and ID)
-            identifiers = []
-            if hf_code:
-                identifiers.append(
-                    ExternalIdentifier(
-                        scheme="other",
-                        value=str(hf_code),
-                        url=f"https://nhfr.mohp.gov.np/health-facility/{hf_code}",
-                        name=LangText(
-                            en=LangTextValue(
-                                value="NHFR Facility Code", provenance="human"
-                            ),
-                        ),
-                    )
-                )
-            if hf_id:
-                identifiers.append(
-                    ExternalIdentifier(
-                        scheme="other",
-                        value=str(hf_id),
-                        name=LangText(
-                            en=LangTextValue(value="NHFR ID", provenance="human"),
-                        ),
-                    )
-                )
+    # Slugs already used by hospitals, including ones from earlier runs; the
+    # stored JSON is enough, so the entities are not validated into models
+    taken_slugs = {
+        e["slug"]
+        for e in await context.db.list_entities_raw(
+            limit=15_000, entity_type="organization", sub_type="hospital"
+        )
+    }
+    pending: list[tuple] = []
+    total = len(hospitals)
+
+    async def flush_pending() -> None:
+        """Create the pending hospitals, then their relationships, in bulk."""
+        nonlocal relationships_count
+        if not pending:
+            return
+        hospitals_created = await context.publication.create_entities_bulk(
+            entity_type=EntityType.ORGANIZATION,
+            entity_subtype=EntitySubType.HOSPITAL,
+            entities_data=[entry[0] for entry in pending],
+            author_id=author_id,
+            change_description=CHANGE_DESCRIPTION,
+        )
+        relationships_data = []
+        for hospital, (
+            _,
+            location_id,
+            location_entity,
+            location_name,
+            province_id,
+            province_entity,
+            province_name,
+        ) in zip(hospitals_created, pending):
+            created_entity_ids.append(hospital.id)
 
-            # Build address with location linking using caches
-            location_id = None
-            location_entity = None
-            province_id = None
-            province_entity = None
-
-            if province_name:
-                p_key_norm = _normalize_location_name(province_name)
-                p_key_norm = LOCATION_NAME_ALIASES.get(p_key_norm, p_key_norm)
-                p_key_full = province_name.strip().lower()
-                pe = province_lookup.get(p_key_norm) or province_lookup.get(p_key_full)
-                if pe:
-                    province_id = pe.id
-                    province_entity = pe
-
-            primary_loc_name = location_name
-            if primary_loc_name:
-                l_key_norm = _normalize_location_name(primary_loc_name)
-                l_key_norm = LOCATION_NAME_ALIASES.get(l_key_norm, l_key_norm)
-                l_key_full = primary_loc_name.strip().lower()
-                le = district_lookup.get(l_key_norm) or municipality_lookup.get(
-                    l_key_norm
+            # Queue LOCATED_IN relationships
+            if location_id and location_entity:
+                location_name_display = (
+                    location_entity.names[0].en.full
+                    if location_entity.names[0].en
+                    else location_name
                 )
-                if not le:
-                    le = district_lookup.get(l_key_full) or municipality_lookup.get(
-                        l_key_full
+                relationships_data.append(
+                    dict(
+                        source_entity_id=hospital.id,
+                        target_entity_id=location_id,
+                        relationship_type="LOCATED_IN",
+                        change_description=f"Hospital located in {location_name_display}",
                     )
-                if le:
-                    location_id = le.id
-                    location_entity = le
-                    linked_count += 1
-
-            if primary_loc_name and not location_entity:
-                fixed = _normalize_location_name(primary_loc_name)
-                raise ValueError(
-                    f"Unresolvable location '{primary_loc_name}' (normalized='{fixed}')"
                 )
 
-            if province_name and not province_entity:
-                fixed = _normalize_location_name(province_name)
-                raise ValueError(
-                    f"Unresolvable province '{province_name}' (normalized='{fixed}')"
-                )
-
-            primary_loc_name = location_name
-            if primary_loc_name:
-                l_key_norm = _normalize_location_name(primary_loc_name)
-                l_key_norm = LOCATION_NAME_ALIASES.get(l_key_norm, l_key_norm)
-                l_key_full = primary_loc_name.strip().lower()
-                le = district_lookup.get(l_key_norm) or municipality_lookup.get(
-                    l_key_norm
+            if province_id and province_entity:
+                province_name_display = (
+                    province_entity.names[0].en.full
+                    if province_entity.names[0].en
+                    else province_name
                 )
-                if not le:
-                    le = district_lookup.get(l_key_full) or municipality_lookup.get(
-                        l_key_full
+                relationships_data.append(
+                    dict(
+                        source_entity_id=hospital.id,
+                        target_entity_id=province_id,
+                        relationship_type="LOCATED_IN",
+                        change_description=f"Hospital located in {province_name_display}",
                     )
-                if le:
-                    location_id = le.id
-                    location_entity = le
-                    linked_count += 1
-
-            if primary_loc_name and not location_entity:
-                fixed = _normalize_location_name(primary_loc_name)
-                raise ValueError(
-                    f"Unresolvable location '{primary_loc_name}' (normalized='{fixed}')"
                 )
 
-            if province_name and not province_entity:
-                fixed = _normalize_location_name(province_name)
-                raise ValueError(
-                    f"Unresolvable province '{province_name}' (normalized='{fixed}')"
-                )
+        try:
+            rels = await context.publication.create_relationships_bulk(
+                relationships_data=relationships_data, author_id=author_id
+            )
+        except Exception as e:
+            context.log(f"  ERROR: Failed to create LOCATED_IN relationships: {e}")
+            raise
+        relationships_count += len(rels)
+        created_relationship_ids.extend(rel.id for rel in rels)
+        pending.clear()
+
+        # One progress line per batch instead of one per hospital
+        context.log(
+            f"Created {len(created_entity_ids)}/{total} hospitals, "
+            f"{relationships_count} relationships"
+        )
 
-            # Build address description
-            address = None
-            if (
-                address_parts := ([address_text] if address_text else [])
-                + ([location_name] if location_name else [])
-                + ([province_name] if province_name else [])
-            ):
-                # Filter out empty strings
-                address_parts_clean = [part for part in address_parts if part]
-                if address_parts_clean:
-                    address = Address(
-                        description2=LangText(
-                            en=LangTextValue(
-                                value=" / ".join(address_parts_clean),
-                                provenance="imported",
-                            ),
-                            ne=LangTextValue(
-                                value=" / ".join(address_parts_clean),
-                                provenance="imported",
-                            ),
-                        ),
-                        location_id=location_id,
-                    )
+    def prepare_hospital(hospital_data: dict) -> tuple | None:
+        """Build the entity payload and resolved locations for one hospital."""
+        nonlocal skipped_count, linked_count
+        row = _extract(hospital_data)
+        if not row.name_en:
+            skipped_count += 1
+            return None
+
+        # Build address text
+        muni = row.municipality_name
+        if muni and row.ward:
+            muni = f"{muni}, Ward {row.ward}"
+        address_text = ", ".join(
+            p for p in (muni, row.district_name, row.province_name) if p
+        )
 
-            # Build description (from facility level and type)
-            description = None
-            description_parts = []
-            if facility_level:
-                description_parts.append(facility_level)
-            if facility_type and facility_type != "Unknown":
-                description_parts.append(f"({facility_type})")
-
-            if description_parts:
-                description_text = " ".join(description_parts)
-                description = LangText(
-                    en=LangTextValue(value=description_text, provenance="imported"),
-                )
+        # Use the primary location for linking (district or municipality)
+        location_name = row.district_name or row.municipality_name
+
+        # Normalize ownership
+        ownership_normalized = _normalize_ownership(row.ownership)
+
+        # Build names
+        name_en_clean = name_extractor.standardize_name(row.name_en)
+
+        names = [
+            {
+                "kind": NameKind.PRIMARY,
+                "en": {"full": name_en_clean},
+                "ne": {"full": row.name_ne} if row.name_ne else None,
+            }
+        ]
+
+        # Build identifiers (NHFR facility code and ID)
+        identifiers = []
+        if row.hf_code:
+            identifiers.append(
+                {
+                    "scheme": "other",
+                    "value": str(row.hf_code),
+                    "url": f"https://nhfr.mohp.gov.np/health-facility/{row.hf_code}",
+                    "name": HF_CODE_IDENTIFIER_NAME,
+                }
+            )
+        if row.hf_id:
+            identifiers.append(
+                {
+                    "scheme": "other",
+                    "value": str(row.hf_id),
+                    "name": HF_ID_IDENTIFIER_NAME,
+                }
+            )
 
-            slug_candidate = text_to_slug(name_en_clean or name_en)
-            if not slug_candidate or len(slug_candidate) < 3:
-                if hf_code or hf_id:
-                    slug_candidate = f"hf-{text_to_slug(str(hf_code or hf_id))}"
-                else:
-                    parts = [name_en_clean or name_en]
-                    parts.append(municipality_name or district_name)
-                    slug_candidate = text_to_slug("-".join([p for p in parts if p]))
-                if not slug_candidate or len(slug_candidate) < 3:
-                    slug_candidate = (
-                        f"hf-{text_to_slug(str(hf_id or hf_code or 'unknown'))}"
-                    )
+        # Build address with location linking using caches
+        location_id = None
+        location_entity = None
+        province_id = None
+        province_entity = None
+
+        if row.province_name:
+            pe = resolve_province(row.province_name)
+            if pe:
+                province_id = pe.id
+                province_entity = pe
+
+        primary_loc_name = location_name
+        if primary_loc_name:
+            le = resolve_location(primary_loc_name)
+            if le:
+                location_id = le.id
+                location_entity = le
+                linked_count += 1
+
+        if primary_loc_name and not location_entity:
+            fixed = _normalize_location_name(primary_loc_name)
+            raise ValueError(
+                f"Unresolvable location '{primary_loc_name}' (normalized='{fixed}')"
+            )
 
-            entity_data = dict(
-                slug=slug_candidate,
-                names=names,
-                attributions=attributions,
-                identifiers=identifiers if identifiers else None,
-                description=description.model_dump() if description else None,
+        if row.province_name and not province_entity:
+            fixed = _normalize_location_name(row.province_name)
+            raise ValueError(
+                f"Unresolvable province '{row.province_name}' (normalized='{fixed}')"
             )
 
-            # Add Hospital-specific fields (only if not None)
-            if beds is not None:
-                entity_data["beds"] = beds
+        # Build address description
+        address = None
+        address_parts = [
+            p for p in (address_text, location_name, row.province_name) if p
+        ]
+        if address_parts:
+            address_value = {
+                "value": " / ".join(address_parts),
+                "provenance": "imported",
+            }
+            address = {"description2": {"en": address_value, "ne": address_value}}
+            if location_id is not None:
+                address["location_id"] = location_id
+
+        # Build description (from facility level and type)
+        description = None
+        description_parts = []
+        if row.facility_level:
+            description_parts.append(row.facility_level)
+        if row.facility_type and row.facility_type != "Unknown":
+            description_parts.append(f"({row.facility_type})")
+
+        if description_parts:
+            description_text = " ".join(description_parts)
+            description = {
+                "en": {"value": description_text, "provenance": "imported"},
+            }
+
+        slug_candidate = _slug(name_en_clean)
+        if not slug_candidate or len(slug_candidate) < 3:
+            if row.hf_code or row.hf_id:
+                slug_candidate = f"hf-{_slug(str(row.hf_code or row.hf_id))}"
+            else:
+                parts = [name_en_clean or row.name_en]
+                parts.append(row.municipality_name or row.district_name)
+                slug_candidate = _slug("-".join([p for p in parts if p]))
+            if not slug_candidate or len(slug_candidate) < 3:
+                slug_candidate = (
+                    f"hf-{_slug(str(row.hf_id or row.hf_code or 'unknown'))}"
+                )
 
-            if ownership_normalized != "Unknown":
-                entity_data["ownership"] = ownership_normalized
+        entity_data = dict(
+            slug=slug_candidate,
+            names=names,
+            attributions=attributions,
+            identifiers=identifiers if identifiers else None,
+            description=description,
+        )
 
-            # Address - only add if it exists and has valid data
-            if address:
-                # Use model_dump with exclude to remove deprecated description field
-                address_dict = address.model_dump(
-                    exclude={"description"}, exclude_none=True
-                )
-                if address_dict:
-                    entity_data["address"] = address_dict
-
-            # Build attributes (for additional metadata)
-            attributes = {}
-            if facility_type != "Unknown":
-                attributes["facility_type"] = facility_type
-            if facility_level:
-                attributes["facility_level"] = facility_level
-            if contact_person:
-                attributes["contact_person"] = contact_person
-            if contact_mobile:
-                attributes["contact_mobile"] = contact_mobile
-            if latitude and longitude:
-                attributes["coordinates"] = {
-                    "latitude": latitude,
-                    "longitude": longitude,
-                }
+        # Add Hospital-specific fields (only if not None)
+        if row.beds is not None:
+            entity_data["beds"] = row.beds
+
+        if ownership_normalized != "Unknown":
+            entity_data["ownership"] = ownership_normalized
+
+        # Address - only add if it exists (never carries the deprecated description)
+        if address:
+            entity_data["address"] = address
+
+        # Build attributes (for additional metadata)
+        attributes = {}
+        if row.facility_type != "Unknown":
+            attributes["facility_type"] = row.facility_type
+        if row.facility_level:
+            attributes["facility_level"] = row.facility_level
+        if row.contact_person:
+            attributes["contact_person"] = row.contact_person
+        if row.contact_mobile:
+            attributes["contact_mobile"] = row.contact_mobile
+        if row.latitude and row.longitude:
+            attributes["coordinates"] = {
+                "latitude": row.latitude,
+                "longitude": row.longitude,
+            }
+
+        if attributes:
+            entity_data["attributes"] = attributes
+
+        return (
+            entity_data,
+            location_id,
+            location_entity,
+            location_name,
+            province_id,
+            province_entity,
+            row.province_name,
+        )
 
-            if attributes:
-                entity_data["attributes"] = attributes
+    try:
+        for index, hospital_data in enumerate(hospitals):
+            # Drop the raw record once read; only the prepared batch is kept
+            hospitals[index] = None
+            prepared = prepare_hospital(hospital_data)
+            if prepared is None:
+                continue
+            entity_data = prepared[0]
 
+            # Resolve slug collisions up front so each batch is conflict-free
             base_slug = entity_data["slug"]
-            try:
-                hospital = await context.publication.create_entity(
-                    entity_type=EntityType.ORGANIZATION,
-                    entity_subtype=EntitySubType.HOSPITAL,
-                    entity_data=entity_data,
-                    author_id=author_id,
-                    change_description=CHANGE_DESCRIPTION,
-                )
-            except ValueError as e:
-                msg = str(e)
-                if "already exists" in msg:
-                    i = 2
-                    while True:
-                        entity_data["slug"] = f"{base_slug}-{i}"
-                        try:
-                            hospital = await context.publication.create_entity(
-                                entity_type=EntityType.ORGANIZATION,
-                                entity_subtype=EntitySubType.HOSPITAL,
-                                entity_data=entity_data,
-                                author_id=author_id,
-                                change_description=CHANGE_DESCRIPTION,
-                            )
-                            break
-                        except ValueError as e2:
-                            if "already exists" in str(e2):
-                                i += 1
-                                continue
-                            raise
-                else:
-                    raise
-            context.log(f"Created hospital {hospital.id}")
-            created_entity_ids.append(hospital.id)
+            i = 2
+            while entity_data["slug"] in taken_slugs:
+                entity_data["slug"] = f"{base_slug}-{i}"
+                i += 1
+            taken_slugs.add(entity_data["slug"])
 
-            # Create LOCATED_IN relationships
-            if location_id and location_entity:
-                try:
-                    location_name_display = (
-                        location_entity.names[0].en.full
-                        if location_entity.names[0].en
-                        else location_name
-                    )
-                    rel = await context.publication.create_relationship(
-                        source_entity_id=hospital.id,
-                        target_entity_id=location_id,
-                        relationship_type="LOCATED_IN",
-                        author_id=author_id,
-                        change_description=f"Hospital located in {location_name_display}",
-                    )
-                    relationships_count += 1
-                    created_relationship_ids.append(rel.id)
-                    context.log(
-                        f"  Created LOCATED_IN relationship: {hospital.id} → {location_id}"
-                    )
-                except Exception as e:
-                    context.log(
-                        f"  ERROR: Failed to create LOCATED_IN relationship with location: {e}"
-                    )
-                    raise
-
-            if province_id and province_entity:
-                try:
-                    province_name_display = (
-                        province_entity.names[0].en.full
-                        if province_entity.names[0].en
-                        else province_name
-                    )
-                    rel = await context.publication.create_relationship(
-                        source_entity_id=hospital.id,
-                        target_entity_id=province_id,
-                        relationship_type="LOCATED_IN",
-                        author_id=author_id,
-                        change_description=f"Hospital located in {province_name_display}",
-                    )
-                    relationships_count += 1
-                    created_relationship_ids.append(rel.id)
-                    context.log(
-                        f"  Created LOCATED_IN relationship: {hospital.id} → {province_id}"
-                    )
-                except Exception as e:
-                    context.log(
-                        f"  ERROR: Failed to create LOCATED_IN relationship with province: {e}"
-                    )
-                    raise
+            pending.append(prepared)
+            if len(pending) >= BULK_BATCH_SIZE:
+                await flush_pending()
 
             count += 1
 
+        await flush_pending()
+
         context.log(f"Created {count} health facility entities")
         context.log(f"Skipped {skipped_count} facilities (no name)")
         context.log(f"Linked {linked_count} facilities to location entities")
         context.log(f"Created {relationships_count} LOCATED_IN relationships")
 
-        entities = await context.db.list_entities(
-            limit=15_000, entity_type="organization", sub_type="hospital"
+        verified = await context.db.count_entities(
+            entity_type="organization", sub_type="hospital"
         )
-        context.log(f"Verified: {len(entities)} hospital entities in database")
+        context.log(f"Verified: {verified} hospital entities in database")
 
         context.log("Migration completed successfully")
 
@@ -698,14 +665,7 @@ def _normalize_ownership(ownership: str) -> str:
         return "Unknown"
 
     ownership_lower = ownership.lower()
-
-    if any(keyword in ownership_lower for keyword in ["government", "govt", "state"]):
-        return "Government"
-    elif any(
-        keyword in ownership_lower for keyword in ["public", "municipal", "community"]
-    ):
-        return "Public"
-    elif any(keyword in ownership_lower for keyword in ["private", "privately"]):
-        return "Private"
-    else:
-        return "Unknown"
+    for keyword, ownership_type in OWNERSHIP_KEYWORDS:
+        if keyword in ownership_lower:
+            return ownership_type.value
+    return "Unknown"
@@ -17,10 +17,13 @@ import argparse
 import asyncio
 import json
 import logging
+import math
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 import httpx
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -33,65 +36,36 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://nhfr.mohp.gov.np/health-registry/search"
 
 
-async def fetch_page(
+async def fetch_page_data(
     client: httpx.AsyncClient,
     page: int = 1,
     page_size: int = 100,
-    filters: Optional[Dict[str, Any]] = None,
-) -> List[Dict[str, Any]]:
-    """Fetch a single page of health facilities.
+    filters: Optional[Union[Dict[str, Any], httpx.QueryParams]] = None,
+) -> Any:
+    """Fetch a single page of health facilities as decoded JSON.
 
     Args:
         client: HTTP client
         page: Page number (1-indexed)
         page_size: Number of records per page
-        filters: Optional filters to apply
+        filters: Optional filters to apply, as a dict or pre-encoded params
 
     Returns:
-        List of health facility records
+        The decoded response body ([] if the page does not exist)
     """
-    params: Dict[str, Any] = {}
-
     # Add pagination params (API might ignore these if it returns all at once)
-    params["page"] = page
-    params["per_page"] = page_size
+    params = httpx.QueryParams({"page": page, "per_page": page_size})
 
     # Add filters if provided
     if filters:
-        params.update(filters)
+        params = params.merge(filters)
 
     try:
         logger.info(f"Fetching page {page} (page_size={page_size})...")
         response = await client.get(BASE_URL, params=params, timeout=60.0)
         response.raise_for_status()
 
-        data = response.json()
-
-        # Check if data is a list (direct array response - most common)
-        if isinstance(data, list):
-            return data
-
-        # Check if data is wrapped in an object with pagination info
-        if isinstance(data, dict):
-            # Try common pagination response formats
-            if "data" in data:
-                records = data["data"]
-                if isinstance(records, list):
-                    return records
-            if "results" in data:
-                records = data["results"]
-                if isinstance(records, list):
-                    return records
-            if "items" in data:
-                records = data["items"]
-                if isinstance(records, list):
-                    return records
-            # If the dict itself contains array-like structure, return values
-            if len(data) == 1 and isinstance(list(data.values())[0], list):
-                return list(data.values())[0]
-
-        logger.warning(f"Unexpected response format on page {page}: {type(data)}")
-        return []
+        return response.json()
 
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error on page {page}: {e.response.status_code}")
@@ -103,87 +77,269 @@ async def fetch_page(
         raise
 
 
-async def fetch_all(
+def records_from_data(data: Any, page: int = 1) -> List[Dict[str, Any]]:
+    """Pull the health facility records out of a decoded page.
+
+    Args:
+        data: Decoded response body
+        page: Page number, for logging
+
+    Returns:
+        List of health facility records
+    """
+    # Check if data is a list (direct array response - most common)
+    if isinstance(data, list):
+        return data
+
+    # Check if data is wrapped in an object with pagination info
+    if isinstance(data, dict):
+        # Try common pagination response formats
+        if "data" in data:
+            records = data["data"]
+            if isinstance(records, list):
+                return records
+        if "results" in data:
+            records = data["results"]
+            if isinstance(records, list):
+                return records
+        if "items" in data:
+            records = data["items"]
+            if isinstance(records, list):
+                return records
+        # If the dict itself contains array-like structure, return values
+        if len(data) == 1:
+            only = next(iter(data.values()))
+            if isinstance(only, list):
+                return only
+
+    logger.warning(f"Unexpected response format on page {page}: {type(data)}")
+    return []
+
+
+def total_count_from_data(data: Any) -> Optional[int]:
+    """Read the total record count from a wrapped page, if the API sends one.
+
+    Args:
+        data: Decoded response body
+
+    Returns:
+        Total number of records, or None when the response doesn't say
+    """
+    if isinstance(data, dict):
+        for key in ("total", "total_count", "count"):
+            value = data.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+    return None
+
+
+async def fetch_page(
+    client: httpx.AsyncClient,
+    page: int = 1,
+    page_size: int = 100,
+    filters: Optional[Union[Dict[str, Any], httpx.QueryParams]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch a single page of health facilities.
+
+    Args:
+        client: HTTP client
+        page: Page number (1-indexed)
+        page_size: Number of records per page
+        filters: Optional filters to apply, as a dict or pre-encoded params
+
+    Returns:
+        List of health facility records
+    """
+    data = await fetch_page_data(client, page, page_size, filters)
+    return records_from_data(data, page)
+
+
+async def iter_pages(
     filters: Optional[Dict[str, Any]] = None,
     page_size: int = 100,
     max_pages: Optional[int] = None,
     delay: float = 0.5,
-) -> List[Dict[str, Any]]:
-    """Fetch all health facilities with pagination.
+    concurrency: int = 8,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Fetch health facilities page by page, yielding each page's new records.
+
+    The first page is fetched on its own, since the NHFR API typically
+    returns every result in a single response. Later pages are fetched in
+    windows of ``concurrency`` requests at a time and yielded in page order.
 
     Args:
         filters: Optional filters to apply
         page_size: Number of records per page
         max_pages: Maximum number of pages to fetch (None for all)
-        delay: Delay between requests in seconds
+        delay: Minimum time each request slot is held, in seconds
+        concurrency: Maximum number of pages fetched at once
 
-    Returns:
-        List of all health facility records
+    Yields:
+        Health facility records from one page not seen on earlier pages
     """
-    all_records: List[Dict[str, Any]] = []
-    page = 1
     seen_ids = set()  # Track IDs to detect duplicates
+    total = 0
+    # Encode the filters once; every page request reuses them
+    filter_params = httpx.QueryParams(filters or {})
+    sem = asyncio.Semaphore(concurrency)
+
+    def take_page(
+        page: int, records: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Return a page's new records and whether more pages may follow."""
+        nonlocal total
+        if not records:
+            logger.info(f"No more records found at page {page}")
+            return [], False
+
+        # Filter out duplicates
+        new_records = []
+        for record in records:
+            record_id = record.get("id") or record.get("hf_code")
+            if record_id and record_id not in seen_ids:
+                seen_ids.add(record_id)
+                new_records.append(record)
+            elif not record_id:
+                # If no ID, add anyway (might be duplicate but we can't detect)
+                new_records.append(record)
+
+        if not new_records:
+            logger.info(f"No new records at page {page}, stopping")
+            return [], False
+
+        total += len(new_records)
+        logger.info(f"Page {page}: Got {len(new_records)} new records (total: {total})")
+
+        # If we got fewer records than page_size, we've reached the end
+        if len(records) < page_size:
+            logger.info(
+                f"Got fewer records than page_size ({len(records)} < {page_size}), reached end"
+            )
+            return new_records, False
 
+        # More than a page means the API ignored pagination and returned
+        # everything at once (the usual NHFR behaviour), so don't ask again
+        if len(records) > page_size:
+            logger.info(
+                f"Got more records than page_size ({len(records)} > {page_size}), "
+                "API returned all results in one response"
+            )
+            return new_records, False
+
+        return new_records, True
+
+    # One client shared by every page request, with enough keep-alive
+    # connections for a full window of concurrent fetches
     async with httpx.AsyncClient(
         timeout=30.0,
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
         headers={
             "User-Agent": "Nepal Entity Service Bot/2.0 (https://github.com/yourusername/nepal-entity-service)",
             "Accept": "application/json",
         },
         follow_redirects=True,
     ) as client:
-        while True:
-            if max_pages and page > max_pages:
-                logger.info(f"Reached max_pages limit ({max_pages})")
-                break
 
-            records = await fetch_page(
-                client, page=page, page_size=page_size, filters=filters
-            )
+        async def bound_fetch(page: int) -> Any:
+            async with sem:
+                data = await fetch_page_data(
+                    client, page=page, page_size=page_size, filters=filter_params
+                )
+                # Rate limiting: holding the slot for the delay caps the
+                # request rate at `concurrency` per `delay` seconds
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                return data
+
+        first_page = await bound_fetch(1)
+        new_records, more = take_page(1, records_from_data(first_page, 1))
+        if new_records:
+            yield new_records
+        if not more:
+            return
 
-            if not records:
-                logger.info(f"No more records found at page {page}")
-                break
-
-            # Filter out duplicates
-            new_records = []
-            for record in records:
-                record_id = record.get("id") or record.get("hf_code")
-                if record_id and record_id not in seen_ids:
-                    seen_ids.add(record_id)
-                    new_records.append(record)
-                elif not record_id:
-                    # If no ID, add anyway (might be duplicate but we can't detect)
-                    new_records.append(record)
-
-            if not new_records:
-                logger.info(f"No new records at page {page}, stopping")
-                break
-
-            all_records.extend(new_records)
+        # When the API reports its total, the last page is known up front
+        # instead of being found by probing
+        last_page = max_pages
+        total_count = total_count_from_data(first_page)
+        if total_count is not None:
+            last_page = math.ceil(total_count / page_size)
+            if max_pages:
+                last_page = min(last_page, max_pages)
             logger.info(
-                f"Page {page}: Got {len(new_records)} new records "
-                f"(total: {len(all_records)})"
+                f"API reports {total_count} records, fetching {last_page} pages"
             )
 
-            # If we got fewer records than page_size, we've reached the end
-            if len(records) < page_size:
-                logger.info(
-                    f"Got fewer records than page_size ({len(records)} < {page_size}), reached end"
+        # Fetch in windows of `concurrency` pages, so at most one window of
+        # responses is held in memory before being yielded
+        page = 2
+        while not last_page or page <= last_page:
+            last = page + concurrency - 1
+            if last_page:
+                last = min(last, last_page)
+            pages = range(page, last + 1)
+            results = await asyncio.gather(*(bound_fetch(p) for p in pages))
+
+            # Pages are handled in order, so anything past the end is dropped
+            for window_page, data in zip(pages, results):
+                new_records, more = take_page(
+                    window_page, records_from_data(data, window_page)
                 )
-                break
+                if new_records:
+                    yield new_records
+                if not more:
+                    return
 
-            # Note: The NHFR API typically returns all results in a single response
-            # If we got a large number of records on the first page, it's likely all of them
-            # We'll still try the next page to be safe, but if it's empty, we'll stop
+            page = last + 1
+
+        if total_count is None:
+            logger.info(f"Reached max_pages limit ({max_pages})")
+
+
+async def fetch_all(
+    filters: Optional[Dict[str, Any]] = None,
+    page_size: int = 100,
+    max_pages: Optional[int] = None,
+    delay: float = 0.5,
+    concurrency: int = 8,
+) -> List[Dict[str, Any]]:
+    """Fetch all health facilities with pagination.
+
+    Args:
+        filters: Optional filters to apply
+        page_size: Number of records per page
+        max_pages: Maximum number of pages to fetch (None for all)
+        delay: Minimum time each request slot is held, in seconds
+        concurrency: Maximum number of pages fetched at once
+
+    Returns:
+        List of all health facility records
+    """
+    return [
+        record
+        async for records in iter_pages(
+            filters=filters,
+            page_size=page_size,
+            max_pages=max_pages,
+            delay=delay,
+            concurrency=concurrency,
+        )
+        for record in records
+    ]
 
-            page += 1
 
-            # Rate limiting
-            if delay > 0:
-                await asyncio.sleep(delay)
+def _dump_record(record: Dict[str, Any]) -> bytes:
+    """Serialize one record as an element of the indented output array.
 
-    return all_records
+    The layout matches ``json.dump(records, indent=2, ensure_ascii=False)``,
+    but orjson spells some floats differently (``1e-5`` for ``1e-05``) and
+    writes NaN/Infinity as ``null``.
+    """
+    data = orjson.dumps(record, option=orjson.OPT_INDENT_2)
+    # JSON strings never contain raw newlines, so this only re-indents
+    return b"  " + data.replace(b"\n", b"\n  ")
 
 
 async def main():
@@ -217,7 +373,13 @@ async def main():
         "--delay",
         type=float,
         default=0.5,
-        help="Delay between requests in seconds (default: 0.5)",
+        help="Minimum seconds each concurrent request slot is held (default: 0.5)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of pages fetched at once (default: 8)",
     )
     parser.add_argument(
         "--test",
@@ -253,66 +415,72 @@ async def main():
     logger.info("")
 
     try:
-        # Fetch all records
-        records = await fetch_all(
-            filters=filters,
-            page_size=args.page_size,
-            max_pages=max_pages,
-            delay=args.delay,
-        )
-
-        if not records:
-            logger.warning("No records fetched!")
-            return
-
-        # Save to JSON file (clean array only, no pagination metadata)
+        # Stream records to a temporary file as pages arrive, so only one
+        # page is held in memory; it replaces the output once complete
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
 
-        logger.info(f"Saving {len(records)} records to {output_path}...")
+        logger.info(f"Streaming records to {output_path}...")
         logger.info("Output will be a clean JSON array (no pagination metadata)")
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
+        total = 0
+        types: Counter = Counter()
+        provinces: Counter = Counter()
+        districts: Counter = Counter()
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(b"[")
+                async for records in iter_pages(
+                    filters=filters,
+                    page_size=args.page_size,
+                    max_pages=max_pages,
+                    delay=args.delay,
+                    concurrency=args.concurrency,
+                ):
+                    for record in records:
+                        f.write(b",\n" if total else b"\n")
+                        f.write(_dump_record(record))
+                        total += 1
+
+                        # Nested objects may be null in the API response
+                        facility_type = record.get("healthFacilityType") or {}
+                        types[facility_type.get("type_name", "Unknown")] += 1
+                        province = record.get("provinces") or {}
+                        provinces[province.get("nameen", "Unknown")] += 1
+                        district = record.get("districts") or {}
+                        districts[district.get("nameen", "Unknown")] += 1
+                f.write(b"\n]" if total else b"]")
+
+            if total:
+                tmp_path.replace(output_path)
+        finally:
+            # Nothing is left behind if streaming failed or fetched nothing
+            tmp_path.unlink(missing_ok=True)
+
+        if not total:
+            logger.warning("No records fetched!")
+            return
 
         logger.info("")
         logger.info("=" * 70)
         logger.info("Scraping Summary")
         logger.info("=" * 70)
-        logger.info(f"Total records: {len(records)}")
+        logger.info(f"Total records: {total}")
         logger.info(f"Output file: {output_path}")
         logger.info(f"File size: {output_path.stat().st_size / 1024 / 1024:.2f} MB")
         logger.info("=" * 70)
 
         # Print some statistics
-        if records:
-            # Count by type
-            types = {}
-            provinces = {}
-            districts = {}
-            for record in records:
-                hf_type = record.get("healthFacilityType", {}).get(
-                    "type_name", "Unknown"
-                )
-                types[hf_type] = types.get(hf_type, 0) + 1
-
-                province = record.get("provinces", {}).get("nameen", "Unknown")
-                provinces[province] = provinces.get(province, 0) + 1
-
-                district = record.get("districts", {}).get("nameen", "Unknown")
-                districts[district] = districts.get(district, 0) + 1
-
-            logger.info("")
-            logger.info("Statistics:")
-            logger.info(f"  Types: {len(types)} different types")
-            logger.info(f"  Provinces: {len(provinces)} different provinces")
-            logger.info(f"  Districts: {len(districts)} different districts")
-            logger.info("")
-            logger.info("Top 5 types:")
-            for hf_type, count in sorted(
-                types.items(), key=lambda x: x[1], reverse=True
-            )[:5]:
-                logger.info(f"  {hf_type}: {count}")
+        logger.info("")
+        logger.info("Statistics:")
+        logger.info(f"  Types: {len(types)} different types")
+        logger.info(f"  Provinces: {len(provinces)} different provinces")
+        logger.info(f"  Districts: {len(districts)} different districts")
+        logger.info("")
+        logger.info("Top 5 types:")
+        for hf_type, count in types.most_common(5):
+            logger.info(f"  {hf_type}: {count}")
 
     except KeyboardInterrupt:
         logger.info("\nInterrupted by user")
@@ -21,14 +21,23 @@ Environment Variables:
 """
 
 import asyncio
+import functools
 import sys
 
 import click
 
+# Maximum concurrent translation requests when translating piped lines
+TRANSLATE_CONCURRENCY = 8
 
+
+@functools.lru_cache(maxsize=4)
 def get_translation_service(provider_name, model_id=None, region_name=None, **kwargs):
     """Get or create translation service instance.
 
+    Instances are cached per provider configuration, so repeated calls in
+    one process reuse the provider's client instead of re-resolving
+    credentials and opening new connections.
+
     Args:
         provider_name: Name of the LLM provider ("aws" or "google")
         model_id: Model ID to use (None to use provider default)
@@ -136,8 +145,21 @@ def get_translation_service(provider_name, model_id=None, region_name=None, **kw
     show_envvar=True,
     help="Google Cloud project ID (required for google provider)",
 )
+@click.option(
+    "--lines",
+    "per_line",
+    is_flag=True,
+    help="Translate each line of piped input separately, one result per line",
+)
 def translate(
-    text, source_lang, target_lang, provider, model_id, region_name, project_id
+    text,
+    source_lang,
+    target_lang,
+    provider,
+    model_id,
+    region_name,
+    project_id,
+    per_line,
 ):
     """Translate text between English and Nepali using LLM providers.
 
@@ -186,6 +208,12 @@ def translate(
         nes translate --from en --to ne "Ram Chandra Poudel"
         nes translate --region us-west-2 --to ne "Hello"
         echo "Ram Chandra Poudel" | nes translate --to ne
+        cat names.txt | nes translate --to ne
+        cat names.txt | nes translate --lines --to ne
+
+    Piped input is translated as one block by default. With --lines, each
+    non-empty line is translated separately and one translation is printed
+    per input line.
     """
     # Normalize language codes
     if target_lang:
@@ -225,10 +253,13 @@ def translate(
         raise click.Abort()
 
     # Get text from argument or stdin
+    lines = []
     if not text:
         if not sys.stdin.isatty():
             # Read from stdin
             text = sys.stdin.read().strip()
+            if per_line:
+                lines = [line.strip() for line in text.splitlines() if line.strip()]
         else:
             click.echo(
                 "Error: No text provided. Provide text as argument or via stdin.",
@@ -241,6 +272,21 @@ def translate(
         click.echo("Error: Empty text provided.", err=True)
         raise click.Abort()
 
+    # With --lines, several piped lines are translated separately and
+    # concurrently
+    if len(lines) > 1:
+        try:
+            results = asyncio.run(
+                _translate_lines(translator, lines, source_lang, target_lang)
+            )
+        except Exception as e:
+            click.echo(f"Error: Translation failed: {e}", err=True)
+            raise click.Abort()
+
+        for result in results:
+            click.echo(result["translated_text"])
+        return
+
     # Perform translation
     try:
         result = asyncio.run(
@@ -259,6 +305,34 @@ def translate(
         raise click.Abort()
 
 
+async def _translate_lines(
+    translator, lines, source_lang, target_lang, concurrency=TRANSLATE_CONCURRENCY
+):
+    """Translate several lines concurrently, preserving their order.
+
+    Args:
+        translator: Translator instance
+        lines: Texts to translate
+        source_lang: Source language (None to auto-detect)
+        target_lang: Target language
+        concurrency: Maximum number of translation requests in flight
+
+    Returns:
+        Translation result dictionaries, one per line
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def translate_line(line):
+        async with semaphore:
+            return await translator.translate(
+                text=line,
+                source_lang=source_lang,
+                target_lang=target_lang,
+            )
+
+    return await asyncio.gather(*(translate_line(line) for line in lines))
+
+
 def _display_translation(result):
     """Display translation result in human-readable format.
 
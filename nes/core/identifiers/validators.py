@@ -16,6 +16,8 @@ from .builders import (
     break_version_id,
 )
 
+_SLUG_RE = re.compile(SLUG_PATTERN)
+
 
 def is_valid_entity_id(entity_id: str) -> bool:
     """Validate if a string is a valid entity ID format.
@@ -81,7 +83,7 @@ def validate_entity_id(entity_id: str) -> str:
     # Validate slug
     if len(components.slug) < MIN_SLUG_LENGTH or len(components.slug) > MAX_SLUG_LENGTH:
         raise ValueError(f"Entity slug length invalid: {components.slug}")
-    if not re.match(SLUG_PATTERN, components.slug):
+    if not _SLUG_RE.match(components.slug):
         raise ValueError(f"Invalid entity slug format: {components.slug}")
 
     return entity_id
@@ -155,7 +157,7 @@ def validate_author_id(author_id: str) -> str:
     # Validate slug follows same pattern as entity slugs
     if len(components.slug) < MIN_SLUG_LENGTH or len(components.slug) > MAX_SLUG_LENGTH:
         raise ValueError(f"Author slug length invalid: {components.slug}")
-    if not re.match(SLUG_PATTERN, components.slug):
+    if not _SLUG_RE.match(components.slug):
         raise ValueError(f"Invalid author slug format: {components.slug}")
 
     return author_id
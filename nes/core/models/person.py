@@ -6,6 +6,8 @@ from typing import List, Literal, Optional
 
 from pydantic import AnyUrl, BaseModel, ConfigDict, Field, field_validator
 
+from nes.core.identifiers.validators import is_valid_entity_id
+
 from .base import Address, LangText
 from .entity import Entity
 
@@ -43,7 +45,7 @@ class ElectionPosition(str, Enum):
 class Education(BaseModel):
     """Education record for a person."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     institution: LangText = Field(
         ..., description="Name of the educational institution"
@@ -59,7 +61,7 @@ class Education(BaseModel):
 class Position(BaseModel):
     """Position or role held by a person."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     title: LangText = Field(..., description="Job title or position name")
     organization: Optional[LangText] = Field(
@@ -101,7 +103,7 @@ class PersonDetails(BaseModel):
 class ElectionSymbol(BaseModel):
     """Election symbol information."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     symbol_name: LangText = Field(..., description="Symbol name")
     nec_id: Optional[int] = Field(
@@ -113,7 +115,7 @@ class ElectionSymbol(BaseModel):
 class Candidacy(BaseModel):
     """Electoral candidacy record."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     election_year: int = Field(..., description="Election year")
     election_type: ElectionType = Field(
@@ -139,8 +141,6 @@ class Candidacy(BaseModel):
     @field_validator("party_id", "constituency_id")
     @classmethod
     def validate_entity_ids(cls, v: Optional[str]) -> Optional[str]:
-        from nes.core.identifiers.validators import is_valid_entity_id
-
         if v is None:
             return v
 
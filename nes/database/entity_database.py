@@ -80,6 +80,50 @@ class EntityDatabase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_entities_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+        attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+    ) -> List[dict]:
+        """List entity data as plain dictionaries.
+
+        Same filtering and pagination as list_entities, but returns the
+        JSON-compatible entity data instead of Entity models. Intended for
+        bulk read-only passes that do not need validated models.
+
+        Args:
+            limit: Maximum number of entities to return
+            offset: Number of entities to skip
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+            attr_filters: Filter by entity attributes (AND logic)
+
+        Returns:
+            List of entity data dictionaries matching the criteria
+        """
+        pass
+
+    @abstractmethod
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+    ) -> int:
+        """Count entities of a given type/subtype.
+
+        Args:
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+
+        Returns:
+            Number of entities matching the criteria
+        """
+        pass
+
     @abstractmethod
     async def search_entities(
         self,
@@ -20,6 +20,8 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
+
 from nes.core.models.entity import Entity, EntitySubType, EntityType
 from nes.core.models.entity_type_map import ENTITY_TYPE_MAP
 from nes.core.models.location import Location
@@ -118,8 +120,7 @@ class FileDatabase(EntityDatabase):
                 return None
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 return self._entity_from_dict(data)
             except (json.JSONDecodeError, ValueError, KeyError):
@@ -254,6 +255,25 @@ class FileDatabase(EntityDatabase):
                 indent=2,
             )
 
+    def _read_json_file(self, file_path: Path) -> Any:
+        """Read and parse a JSON file.
+
+        Parsed with orjson, whose JSONDecodeError subclasses
+        json.JSONDecodeError.
+
+        Args:
+            file_path: Path to read from
+
+        Returns:
+            Parsed JSON data
+
+        Raises:
+            OSError: If file read fails
+            json.JSONDecodeError: If JSON is malformed
+        """
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+
     async def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Retrieve an entity by its ID.
 
@@ -292,8 +312,7 @@ class FileDatabase(EntityDatabase):
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_file(file_path)
 
             return self._entity_from_dict(data)
 
@@ -383,6 +402,82 @@ class FileDatabase(EntityDatabase):
         # Apply pagination
         return entities[offset : offset + limit]
 
+    async def list_entities_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+        attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+    ) -> List[dict]:
+        """List stored entity data as plain dictionaries.
+
+        Same filtering and pagination as list_entities, but skips Pydantic
+        model validation. Use this for bulk read-only passes over the stored
+        JSON (e.g. data validation scripts) where Entity instances are not
+        needed. Computed fields such as 'id' are not present.
+
+        Args:
+            limit: Maximum number of entities to return
+            offset: Number of entities to skip
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+            attr_filters: Filter by entity attributes (AND logic)
+
+        Returns:
+            List of entity data dictionaries as stored on disk
+        """
+        search_path = self._build_entity_search_path(entity_type, sub_type)
+
+        if not search_path.exists():
+            logger.debug(f"Search path does not exist: {search_path}")
+            return []
+
+        results = []
+
+        for file_path in search_path.rglob("*.json"):
+            if len(results) >= limit + offset:
+                break
+
+            try:
+                data = self._read_json_file(file_path)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping invalid entity file {file_path}: {e}")
+                continue
+
+            if "type" not in data:
+                continue
+            if attr_filters and not self._matches_attribute_filters(data, attr_filters):
+                continue
+
+            results.append(data)
+
+        return results[offset : offset + limit]
+
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+    ) -> int:
+        """Count stored entities of a given type/subtype.
+
+        Counts the entity files under the type/subtype directory without
+        reading or validating them, so it stays cheap for large subtypes.
+
+        Args:
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+
+        Returns:
+            Number of entity files matching the criteria
+        """
+        search_path = self._build_entity_search_path(entity_type, sub_type)
+
+        if not search_path.exists():
+            return 0
+
+        return sum(1 for _ in search_path.rglob("*.json"))
+
     def _build_entity_search_path(
         self, entity_type: Optional[str] = None, sub_type: Optional[str] = None
     ) -> Path:
@@ -420,8 +515,7 @@ class FileDatabase(EntityDatabase):
             json.JSONDecodeError: If JSON is malformed
             ValueError: If entity data is invalid
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         # Check if this is an entity (has 'type' field)
         if "type" not in data:
@@ -744,8 +838,7 @@ class FileDatabase(EntityDatabase):
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_file(file_path)
 
             return Relationship.model_validate(data)
 
@@ -836,8 +929,7 @@ class FileDatabase(EntityDatabase):
             json.JSONDecodeError: If JSON is malformed
             ValueError: If relationship data is invalid
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         # Check if this is a relationship (has source_entity_id)
         if "source_entity_id" not in data:
@@ -885,8 +977,7 @@ class FileDatabase(EntityDatabase):
         # Recursively find all JSON files
         for file_path in search_path.rglob("*.json"):
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a relationship (has source_entity_id)
                 if "source_entity_id" not in data:
@@ -979,8 +1070,7 @@ class FileDatabase(EntityDatabase):
         # Recursively find all JSON files
         for file_path in search_path.rglob("*.json"):
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a relationship (has source_entity_id)
                 if "source_entity_id" not in data:
@@ -1028,8 +1118,7 @@ class FileDatabase(EntityDatabase):
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         return Version.model_validate(data)
 
@@ -1062,8 +1151,7 @@ class FileDatabase(EntityDatabase):
                 break
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a version (has version_number)
                 if "version_number" not in data:
@@ -1128,8 +1216,7 @@ class FileDatabase(EntityDatabase):
         # Find all JSON files in the entity/relationship version directory
         for file_path in search_path.glob("*.json"):
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a version (has version_number)
                 if "version_number" not in data:
@@ -1197,8 +1284,7 @@ class FileDatabase(EntityDatabase):
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         return Author.model_validate(data)
 
@@ -1231,8 +1317,7 @@ class FileDatabase(EntityDatabase):
                 break
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is an author (has slug)
                 if "slug" not in data:
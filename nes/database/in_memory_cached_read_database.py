@@ -175,6 +175,39 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         # Convert back to list
         return list(result_tuple)
 
+    async def list_entities_raw(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+        attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+    ) -> List[dict]:
+        """List cached entities as JSON-compatible dictionaries."""
+        await self._ensure_cache_warmed()
+
+        attr_filters_tuple = None
+        if attr_filters:
+            attr_filters_tuple = tuple(sorted(attr_filters.items()))
+
+        entities = self._list_entities_impl(
+            limit, offset, entity_type, sub_type, attr_filters_tuple
+        )
+        return [entity.model_dump(mode="json") for entity in entities]
+
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+    ) -> int:
+        """Count cached entities of a given type/subtype."""
+        await self._ensure_cache_warmed()
+        return len(
+            self._list_entities_impl(
+                len(self._entity_cache), 0, entity_type, sub_type, None
+            )
+        )
+
     def _search_entities_impl(
         self,
         query: Optional[str],
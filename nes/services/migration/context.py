@@ -11,6 +11,8 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from nes.database.entity_database import EntityDatabase
 from nes.services.publication.service import PublicationService
 from nes.services.scraping.service import ScrapingService
@@ -199,8 +201,7 @@ class MigrationContext:
         logger.debug(f"Reading JSON file: {file_path}")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(file_path.read_bytes())
 
             logger.debug(f"Successfully read JSON from {filename}")
             return data
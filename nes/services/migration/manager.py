@@ -8,17 +8,59 @@ This module provides the MigrationManager class which handles:
 """
 
 import ast
+import asyncio
 import logging
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 
 from nes.services.migration.models import Migration
-from nes.services.migration.validation import validate_migration_naming
+from nes.services.migration.validation import (
+    MIGRATION_NAME_RE,
+    parse_migration_date,
+    validate_migration_naming,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to load migration folders concurrently
+SCAN_WORKERS = 16
+
+
+def _list_names(path: Union[str, Path]) -> set:
+    """Return the names of the entries directly inside a directory."""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
+METADATA_CONSTANTS = ("AUTHOR", "DATE", "DESCRIPTION")
+
+# Top-level `NAME = "value"` lines for the metadata constants
+_METADATA_RE = re.compile(
+    rb"^(AUTHOR|DATE|DESCRIPTION)[ \t]*=[ \t]*"
+    rb"(?:\"([^\"\\\n]*)\"|'([^'\\\n]*)')[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+
+def _parse_metadata_constants(content: bytes, script_path: Path) -> dict:
+    """Read the metadata constants from a script's top-level assignments."""
+    tree = ast.parse(content, filename=str(script_path))
+
+    constants = {}
+    # The constants live at module level, so function bodies are not scanned
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Constant):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id in METADATA_CONSTANTS:
+                constants[target.id] = node.value.value
+        if len(constants) == len(METADATA_CONSTANTS):
+            break
+    return constants
+
 
 class MigrationManager:
     """
@@ -42,6 +84,13 @@ class MigrationManager:
         self.migrations_dir = Path(migrations_dir)
         self.db_path = Path(db_path)
         self._applied_cache: Optional[List[str]] = None
+        self._applied_set: Optional[FrozenSet[str]] = None
+        # Discovered migrations with the folder/script mtimes they were read at
+        self._migrations_cache: Optional[Tuple[tuple, List[Migration]]] = None
+        # Cached discovered migrations keyed by full name
+        self._by_name_index: Optional[Dict[str, Migration]] = None
+        # Parsed script metadata keyed by (script path, mtime in ns)
+        self._metadata_cache: Dict[Tuple[str, int], dict] = {}
 
         logger.info(
             f"MigrationManager initialized: "
@@ -55,6 +104,8 @@ class MigrationManager:
 
         Scans the migrations/ directory for folders matching the NNN-* pattern,
         sorts them by numeric prefix, and loads metadata from script files.
+        The result is cached until a migration folder or script changes (by
+        modification time) or clear_cache() is called.
 
         Returns:
             List of Migration objects sorted by prefix
@@ -65,93 +116,212 @@ class MigrationManager:
             >>> print(migrations[0].full_name)
             '000-initial-locations'
         """
+        if not self._migrations_dir_exists():
+            return []
+
+        candidates = self._enumerate_folders()
+        cache_key = self._discovery_key(candidates)
+        if self._migrations_cache is not None:
+            cached_key, cached_migrations = self._migrations_cache
+            if cached_key == cache_key:
+                logger.debug("Using cached migration discovery")
+                return list(cached_migrations)
+
         logger.info(f"Discovering migrations in {self.migrations_dir}")
 
-        if not self.migrations_dir.exists():
-            logger.warning(
-                f"Migrations directory does not exist: {self.migrations_dir}"
-            )
-            return []
+        migrations = await self._load_migration_folders(candidates)
 
-        migrations = []
+        logger.info(f"Discovered {len(migrations)} migrations")
+        self._migrations_cache = (cache_key, migrations)
+        self._by_name_index = None
+        return list(migrations)
 
-        # Scan for migration folders
-        for folder_path in self.migrations_dir.iterdir():
-            if not folder_path.is_dir():
-                continue
+    def _migrations_dir_exists(self) -> bool:
+        """
+        Check that the migrations directory exists.
 
-            folder_name = folder_path.name
+        Returns:
+            True if it exists; otherwise the discovery caches are dropped
+        """
+        if self.migrations_dir.exists():
+            return True
 
-            # Skip hidden directories and __pycache__
-            if folder_name.startswith(".") or folder_name == "__pycache__":
-                continue
+        logger.warning(f"Migrations directory does not exist: {self.migrations_dir}")
+        self._migrations_cache = None
+        self._by_name_index = None
+        return False
+
+    @staticmethod
+    def _discovery_key(candidates: List[Tuple[str, int, str]]) -> tuple:
+        """
+        Fingerprint enumerated migration folders for the discovery cache.
+
+        Adding or removing a file changes its folder's modification time and
+        editing a script changes the script's, so any change that affects
+        discovery changes the key.
+
+        Args:
+            candidates: (folder path, prefix, name) tuples from
+                _enumerate_folders()
+
+        Returns:
+            Tuple of (folder path, folder mtime, script mtime) per folder
+        """
+        key = []
+        for folder, _, _ in candidates:
+            folder_mtime = script_mtime = None
+            try:
+                folder_mtime = os.stat(folder).st_mtime_ns
+                for script_name in ("migrate.py", "run.py"):
+                    try:
+                        script_path = os.path.join(folder, script_name)
+                        script_mtime = os.stat(script_path).st_mtime_ns
+                        break
+                    except FileNotFoundError:
+                        continue
+            except FileNotFoundError:
+                pass
+            key.append((folder, folder_mtime, script_mtime))
+        return tuple(key)
+
+    def _enumerate_folders(self) -> List[Tuple[str, int, str]]:
+        """
+        List the validly named migration folders without reading any script.
 
-            # Validate naming convention
-            validation_result = validate_migration_naming(folder_name)
-            if not validation_result.is_valid:
+        Returns:
+            List of (folder path, prefix, name) tuples in directory order
+        """
+        # Scan for migration folders, skipping hidden entries and __pycache__
+        # by name before DirEntry.is_dir(), which uses the cached dirent type
+        with os.scandir(self.migrations_dir) as entries:
+            folders = [
+                entry
+                for entry in entries
+                if not entry.name.startswith(".")
+                and entry.name != "__pycache__"
+                and entry.is_dir()
+            ]
+
+        candidates = []
+        for entry in folders:
+            folder_name = entry.name
+
+            # Validate naming convention and extract prefix and name in one
+            # match; the full validation only runs to explain a rejection
+            match = MIGRATION_NAME_RE.match(folder_name)
+            if not match:
+                validation_result = validate_migration_naming(folder_name)
                 logger.warning(
                     f"Skipping invalid migration folder '{folder_name}': "
                     f"{', '.join(validation_result.errors)}"
                 )
                 continue
 
-            # Extract prefix and name
-            match = re.match(r"^(\d{3})-(.+)$", folder_name)
-            if not match:
-                # This shouldn't happen if validation passed, but be defensive
-                logger.warning(f"Skipping folder with unexpected format: {folder_name}")
-                continue
-
             prefix_str, name = match.groups()
-            prefix = int(prefix_str)
+            candidates.append((entry.path, int(prefix_str), name))
 
-            # Find the main script file
-            script_path = folder_path / "migrate.py"
-            if not script_path.exists():
-                script_path = folder_path / "run.py"
+        return candidates
 
-            if not script_path.exists():
-                logger.warning(
-                    f"Skipping migration folder '{folder_name}': "
-                    "no migrate.py or run.py found"
-                )
-                continue
+    async def _load_migration_folders(
+        self, candidates: List[Tuple[str, int, str]]
+    ) -> List[Migration]:
+        """
+        Load the scripts and metadata of enumerated migration folders.
 
-            # Find README
-            readme_path = folder_path / "README.md"
-            if not readme_path.exists():
-                readme_path = None
-
-            # Load metadata from script
-            metadata = self._load_migration_metadata(script_path)
-
-            # Create Migration object
-            migration = Migration(
-                prefix=prefix,
-                name=name,
-                folder_path=folder_path,
-                script_path=script_path,
-                readme_path=readme_path,
-                author=metadata.get("author"),
-                date=metadata.get("date"),
-                description=metadata.get("description"),
-            )
+        Args:
+            candidates: (folder path, prefix, name) tuples from
+                _enumerate_folders()
 
-            migrations.append(migration)
-            logger.debug(f"Discovered migration: {migration.full_name}")
+        Returns:
+            List of Migration objects sorted by prefix
+        """
+        # Listing each folder and reading its script is blocking I/O, slow on
+        # network mounts, so the folders are loaded concurrently in threads
+        migrations = []
+        if candidates:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(
+                max_workers=min(SCAN_WORKERS, len(candidates))
+            ) as pool:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool, self._load_migration_folder, *candidate
+                        )
+                        for candidate in candidates
+                    )
+                )
+            migrations = [migration for migration in results if migration]
 
         # Sort by prefix
         migrations.sort(key=lambda m: m.prefix)
-
-        logger.info(f"Discovered {len(migrations)} migrations")
         return migrations
 
+    def _load_migration_folder(
+        self, folder: str, prefix: int, name: str
+    ) -> Optional[Migration]:
+        """
+        Build the Migration for one validly named migration folder.
+
+        Paths stay plain strings until the Migration is built.
+
+        Args:
+            folder: Path to the migration folder
+            prefix: Numeric prefix parsed from the folder name
+            name: Descriptive name parsed from the folder name
+
+        Returns:
+            Migration object, or None if the folder has no script
+        """
+        # List the folder once instead of stat()ing each candidate file
+        file_names = _list_names(folder)
+
+        # Find the main script file
+        if "migrate.py" in file_names:
+            script_name = "migrate.py"
+        elif "run.py" in file_names:
+            script_name = "run.py"
+        else:
+            logger.warning(
+                f"Skipping migration folder '{os.path.basename(folder)}': "
+                "no migrate.py or run.py found"
+            )
+            return None
+        script_path = Path(os.path.join(folder, script_name))
+
+        # Find README
+        readme_path = (
+            Path(os.path.join(folder, "README.md"))
+            if "README.md" in file_names
+            else None
+        )
+
+        # Load metadata from script
+        metadata = self._load_migration_metadata(script_path)
+
+        # Create Migration object
+        migration = Migration(
+            prefix=prefix,
+            name=name,
+            folder_path=Path(folder),
+            script_path=script_path,
+            readme_path=readme_path,
+            author=metadata.get("author"),
+            date=metadata.get("date"),
+            description=metadata.get("description"),
+        )
+
+        logger.debug("Discovered migration: %s", migration.full_name)
+        return migration
+
     def _load_migration_metadata(self, script_path: Path) -> dict:
         """
         Load metadata from a migration script.
 
-        Extracts AUTHOR, DATE, and DESCRIPTION constants from the script
-        using AST parsing.
+        Extracts AUTHOR, DATE, and DESCRIPTION constants from the script,
+        with a regex for simple string assignments and AST parsing as the
+        fallback. Results are cached per script modification time, so an
+        unchanged script is parsed once per manager.
 
         Args:
             script_path: Path to the migration script
@@ -159,52 +329,49 @@ class MigrationManager:
         Returns:
             Dictionary with 'author', 'date', and 'description' keys
         """
+        try:
+            cache_key = (str(script_path), os.stat(script_path).st_mtime_ns)
+        except OSError:
+            cache_key = None
+        else:
+            cached = self._metadata_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         metadata = {"author": None, "date": None, "description": None}
 
         try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            tree = ast.parse(content, filename=str(script_path))
-
-            # Extract module-level assignments
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            if target.id == "AUTHOR":
-                                if isinstance(node.value, ast.Constant):
-                                    metadata["author"] = node.value.value
-                                elif isinstance(node.value, ast.Str):
-                                    metadata["author"] = node.value.s
-
-                            elif target.id == "DATE":
-                                if isinstance(node.value, ast.Constant):
-                                    date_str = node.value.value
-                                elif isinstance(node.value, ast.Str):
-                                    date_str = node.value.s
-                                else:
-                                    continue
-
-                                # Try to parse date
-                                try:
-                                    metadata["date"] = datetime.strptime(
-                                        date_str, "%Y-%m-%d"
-                                    )
-                                except ValueError:
-                                    logger.warning(
-                                        f"Invalid DATE format in {script_path}: {date_str}"
-                                    )
-
-                            elif target.id == "DESCRIPTION":
-                                if isinstance(node.value, ast.Constant):
-                                    metadata["description"] = node.value.value
-                                elif isinstance(node.value, ast.Str):
-                                    metadata["description"] = node.value.s
+            content = script_path.read_bytes()
+
+            # Fast path: plain one-line string constants, read with a regex
+            constants = {
+                match.group(1)
+                .decode(): (
+                    match.group(2) if match.group(2) is not None else match.group(3)
+                )
+                .decode("utf-8")
+                for match in _METADATA_RE.finditer(content)
+            }
+            # Anything else (escapes, triple quotes, comments) needs the AST
+            if len(constants) < len(METADATA_CONSTANTS):
+                constants = _parse_metadata_constants(content, script_path)
+
+            metadata["author"] = constants.get("AUTHOR")
+            metadata["description"] = constants.get("DESCRIPTION")
+
+            date_str = constants.get("DATE")
+            if date_str is not None:
+                # Try to parse date
+                try:
+                    metadata["date"] = parse_migration_date(date_str)
+                except (TypeError, ValueError):
+                    logger.warning(f"Invalid DATE format in {script_path}: {date_str}")
 
         except Exception as e:
             logger.warning(f"Failed to load metadata from {script_path}: {e}")
 
+        if cache_key is not None:
+            self._metadata_cache[cache_key] = metadata
         return metadata
 
     async def get_applied_migrations(self) -> List[str]:
@@ -230,7 +397,8 @@ class MigrationManager:
         # Return cached result if available
         if self._applied_cache is not None:
             logger.debug(
-                f"Returning cached applied migrations: {len(self._applied_cache)} migrations"
+                "Returning cached applied migrations: %d migrations",
+                len(self._applied_cache),
             )
             return self._applied_cache
 
@@ -255,16 +423,15 @@ class MigrationManager:
             applied = []
 
             # Scan migration logs directory for migration folders
-            for log_folder in migration_logs_dir.iterdir():
-                if not log_folder.is_dir():
-                    continue
+            with os.scandir(migration_logs_dir) as entries:
+                log_folders = [entry for entry in entries if entry.is_dir()]
 
+            for log_folder in log_folders:
                 # Check if metadata.json exists (indicates completed migration)
-                metadata_file = log_folder / "metadata.json"
-                if metadata_file.exists():
+                if "metadata.json" in _list_names(log_folder.path):
                     migration_name = log_folder.name
                     applied.append(migration_name)
-                    logger.debug(f"Found applied migration: {migration_name}")
+                    logger.debug("Found applied migration: %s", migration_name)
 
             # Cache the results
             self._applied_cache = applied
@@ -279,13 +446,31 @@ class MigrationManager:
 
     def clear_cache(self) -> None:
         """
-        Clear the cached list of applied migrations.
+        Clear the cached applied and discovered migrations.
 
         Call this method to force a refresh of the applied migrations list
-        from migration logs on the next call to get_applied_migrations().
+        from migration logs on the next call to get_applied_migrations(), and
+        a rescan of the migrations directory on the next discover_migrations().
         """
-        logger.debug("Clearing applied migrations cache")
+        logger.debug("Clearing migration caches")
         self._applied_cache = None
+        self._applied_set = None
+        self._migrations_cache = None
+        self._by_name_index = None
+
+    async def _get_applied_set(self) -> FrozenSet[str]:
+        """
+        Get the applied migration names as a set for membership checks.
+
+        Built from (and cleared with) the cached applied migrations list.
+
+        Returns:
+            Frozen set of applied migration names
+        """
+        applied = await self.get_applied_migrations()
+        if self._applied_set is None:
+            self._applied_set = frozenset(applied)
+        return self._applied_set
 
     async def get_pending_migrations(self) -> List[Migration]:
         """
@@ -307,20 +492,35 @@ class MigrationManager:
         """
         logger.info("Determining pending migrations")
 
-        # Get all migrations
-        all_migrations = await self.discover_migrations()
-        logger.debug(f"Total migrations discovered: {len(all_migrations)}")
-
         # Get applied migrations
-        applied = await self.get_applied_migrations()
-        logger.debug(f"Applied migrations: {len(applied)}")
+        applied = await self._get_applied_set()
+        logger.debug("Applied migrations: %d", len(applied))
 
-        # Filter to only pending migrations
-        pending = []
-        for migration in all_migrations:
-            if migration.full_name not in applied:
-                pending.append(migration)
-                logger.debug(f"Pending migration: {migration.full_name}")
+        if not self._migrations_dir_exists():
+            return []
+
+        candidates = self._enumerate_folders()
+        if self._migrations_cache is not None and self._migrations_cache[
+            0
+        ] == self._discovery_key(candidates):
+            # Filter the cached discovery
+            pending = [
+                migration
+                for migration in self._migrations_cache[1]
+                if migration.full_name not in applied
+            ]
+        else:
+            # Filter on folder names first so only pending scripts are read
+            pending = await self._load_migration_folders(
+                [
+                    (folder, prefix, name)
+                    for folder, prefix, name in candidates
+                    if f"{prefix:03d}-{name}" not in applied
+                ]
+            )
+
+        for migration in pending:
+            logger.debug("Pending migration: %s", migration.full_name)
 
         logger.info(f"Found {len(pending)} pending migrations")
         return pending
@@ -342,12 +542,13 @@ class MigrationManager:
             >>> print(is_applied)
             True
         """
-        applied = await self.get_applied_migrations()
+        applied = await self._get_applied_set()
         is_applied = migration.full_name in applied
 
         logger.debug(
-            f"Migration {migration.full_name} is "
-            f"{'applied' if is_applied else 'pending'}"
+            "Migration %s is %s",
+            migration.full_name,
+            "applied" if is_applied else "pending",
         )
 
         return is_applied
@@ -368,8 +569,10 @@ class MigrationManager:
         """
         migrations = await self.discover_migrations()
 
-        for migration in migrations:
-            if migration.full_name == name:
-                return migration
+        # Index the discovered migrations once; a rescan resets the index
+        if self._by_name_index is None:
+            self._by_name_index = {
+                migration.full_name: migration for migration in migrations
+            }
 
-        return None
+        return self._by_name_index.get(name)
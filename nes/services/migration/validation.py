@@ -14,6 +14,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+# Migration folder pattern: NNN-descriptive-name
+MIGRATION_NAME_RE = re.compile(r"^(\d{3})-([a-z0-9]+(?:-[a-z0-9]+)*)$")
+
 
 @dataclass
 class ValidationResult:
@@ -43,6 +46,25 @@ class ValidationResult:
             return f"Validation failed with {len(self.errors)} error(s)"
 
 
+def parse_migration_date(date_str: str) -> datetime:
+    """
+    Parse a migration DATE constant (YYYY-MM-DD).
+
+    Shared by migration discovery and validation so both accept exactly
+    the same dates.
+
+    Args:
+        date_str: Value of the DATE constant
+
+    Returns:
+        The parsed date as a datetime at midnight
+
+    Raises:
+        ValueError: If the value is not in YYYY-MM-DD format
+    """
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
 def validate_migration_naming(folder_name: str) -> ValidationResult:
     """
     Validate migration folder naming convention.
@@ -66,9 +88,7 @@ def validate_migration_naming(folder_name: str) -> ValidationResult:
     errors = []
     warnings = []
 
-    # Pattern: NNN-descriptive-name
-    pattern = r"^(\d{3})-([a-z0-9]+(?:-[a-z0-9]+)*)$"
-    match = re.match(pattern, folder_name)
+    match = MIGRATION_NAME_RE.match(folder_name)
 
     if not match:
         errors.append(
@@ -255,8 +275,7 @@ def validate_migration_metadata(script_path: Path) -> ValidationResult:
         if "DATE" in metadata:
             date_str = metadata["DATE"]
             try:
-                # Try to parse as YYYY-MM-DD
-                datetime.strptime(date_str, "%Y-%m-%d")
+                parse_migration_date(date_str)
             except ValueError:
                 errors.append(
                     f"DATE '{date_str}' is not in YYYY-MM-DD format "
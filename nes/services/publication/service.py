@@ -9,10 +9,14 @@ The Publication Service is the central orchestration layer that manages:
 - Business rule enforcement
 """
 
+import asyncio
+import functools
 import logging
 from datetime import UTC, date, datetime
 from typing import Any, Dict, List, Optional
 
+from pydantic import TypeAdapter
+
 from nes.core.models.base import Name, NameKind
 from nes.core.models.entity import Entity, EntitySubType, EntityType
 from nes.core.models.location import Location
@@ -31,6 +35,12 @@ from nes.database.entity_database import EntityDatabase
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _entity_list_adapter(model_cls: type) -> TypeAdapter:
+    """Return a cached adapter that validates a list of one entity model."""
+    return TypeAdapter(List[model_cls])
+
+
 class PublicationService:
     """Service for publishing and managing entities and relationships.
 
@@ -91,19 +101,8 @@ class PublicationService:
         # Extract entity_subtype from entity_data if not provided explicitly
         if entity_subtype is None and entity_data.get("sub_type"):
             entity_subtype = EntitySubType(entity_data["sub_type"])
-        # Validate required fields
-        if "slug" not in entity_data:
-            raise ValueError("Entity must have a 'slug' field")
-        if "names" not in entity_data or not entity_data["names"]:
-            raise ValueError("Entity must have at least one name")
 
-        # Validate that at least one name has kind='PRIMARY'
-        has_primary = any(
-            name.get("kind") == "PRIMARY" or name.get("kind") == NameKind.PRIMARY
-            for name in entity_data["names"]
-        )
-        if not has_primary:
-            raise ValueError("Entity must have at least one name with kind='PRIMARY'")
+        self._validate_new_entity_data(entity_data)
 
         # Get or create author
         author = await self._get_or_create_author(author_id)
@@ -124,44 +123,143 @@ class PublicationService:
                 f"Entity with slug '{slug}' and type '{entity_type}' already exists"
             )
 
-        # Create version summary
-        version_summary = VersionSummary(
-            entity_or_relationship_id=entity_id,
-            type=VersionType.ENTITY,
-            version_number=1,
-            author=author,
-            change_description=change_description,
-            created_at=datetime.now(UTC),
+        entity, version = self._build_new_entity(
+            entity_id,
+            entity_type,
+            entity_subtype,
+            entity_data,
+            author,
+            change_description,
         )
 
-        # Add type, subtype, version summary and created_at to entity data
-        entity_data["type"] = entity_type.value
-        if entity_subtype:
-            entity_data["sub_type"] = entity_subtype.value
-        entity_data["version_summary"] = version_summary
-        entity_data["created_at"] = datetime.now(UTC)
-
-        # Create entity instance based on type
-        entity = self._create_entity_instance(entity_data)
-
         # Store entity in database
         await self.database.put_entity(entity)
-
-        # Create and store version with snapshot
-        version = Version(
-            entity_or_relationship_id=entity_id,
-            type=VersionType.ENTITY,
-            version_number=1,
-            author=author,
-            change_description=change_description,
-            created_at=version_summary.created_at,
-            snapshot=entity.model_dump(mode="json"),
-        )
         await self.database.put_version(version)
 
         logger.info(f"Created entity {entity_id} version 1")
         return entity
 
+    async def create_entities_bulk(
+        self,
+        entity_type: EntityType,
+        entities_data: List[Dict[str, Any]],
+        author_id: str,
+        change_description: str = "Initial entity creation",
+        entity_subtype: Optional[EntitySubType] = None,
+    ) -> List[Entity]:
+        """Create many entities of one type in a single pass.
+
+        Every entity is validated, checked for duplicates (within the batch
+        and against the database) and instantiated before anything is
+        written, so an invalid record fails the whole batch without partial
+        writes; if storing fails midway, the entities already stored are
+        deleted. The author is resolved once for the batch. As in
+        create_entity, a record's own 'sub_type' is used when entity_subtype
+        is not given, so one batch may mix subtypes.
+
+        Args:
+            entity_type: Type shared by all entities in the batch
+            entities_data: List of entity data dictionaries
+            author_id: ID of the author creating the entities
+            change_description: Description of this change
+            entity_subtype: Optional subtype shared by all entities (overrides
+                each record's 'sub_type')
+
+        Returns:
+            Created entities (each with version 1), in input order
+
+        Raises:
+            ValueError: If any entity is invalid or already exists
+        """
+        if not entities_data:
+            return []
+        if author_id is None:
+            raise ValueError("author_id is required")
+
+        from nes.core.identifiers import build_entity_id
+
+        entity_ids = []
+        entity_subtypes = []
+        seen = set()
+        for entity_data in entities_data:
+            self._validate_new_entity_data(entity_data)
+
+            # Resolve the subtype per record, as create_entity does
+            record_subtype = entity_subtype
+            if record_subtype is None and entity_data.get("sub_type"):
+                record_subtype = EntitySubType(entity_data["sub_type"])
+
+            entity_id = build_entity_id(
+                entity_type.value,
+                record_subtype.value if record_subtype else None,
+                entity_data["slug"],
+            )
+            if entity_id in seen:
+                raise ValueError(
+                    f"Duplicate slug '{entity_data['slug']}' in bulk create batch"
+                )
+            seen.add(entity_id)
+            entity_ids.append(entity_id)
+            entity_subtypes.append(record_subtype)
+
+        existing = await asyncio.gather(
+            *(self.database.get_entity(entity_id) for entity_id in entity_ids)
+        )
+        for entity_id, found in zip(entity_ids, existing):
+            if found:
+                raise ValueError(f"Entity '{entity_id}' already exists")
+
+        author = await self._get_or_create_author(author_id)
+
+        version_summaries = [
+            self._stamp_new_entity_data(
+                entity_id,
+                entity_type,
+                record_subtype,
+                entity_data,
+                author,
+                change_description,
+            )
+            for entity_id, record_subtype, entity_data in zip(
+                entity_ids, entity_subtypes, entities_data
+            )
+        ]
+
+        # Validate the records of each model class in a single call
+        indexes_by_model: Dict[type, List[int]] = {}
+        for index, entity_data in enumerate(entities_data):
+            model_cls = self._entity_model_class(entity_data)
+            indexes_by_model.setdefault(model_cls, []).append(index)
+        entities: List[Entity] = [None] * len(entities_data)
+        for model_cls, indexes in indexes_by_model.items():
+            validated = _entity_list_adapter(model_cls).validate_python(
+                [entities_data[index] for index in indexes]
+            )
+            for index, entity in zip(indexes, validated):
+                entities[index] = entity
+        versions = [
+            self._build_first_version(entity, version_summary)
+            for entity, version_summary in zip(entities, version_summaries)
+        ]
+
+        undo_steps = []
+        try:
+            for entity, version in zip(entities, versions):
+                await self.database.put_entity(entity)
+                undo_steps.append(
+                    functools.partial(self.database.delete_entity, entity.id)
+                )
+                await self.database.put_version(version)
+                undo_steps.append(
+                    functools.partial(self.database.delete_version, version.id)
+                )
+        except Exception:
+            await self._undo_bulk_writes(undo_steps)
+            raise
+
+        logger.info(f"Created {len(entities)} entities in bulk")
+        return entities
+
     async def update_entity(
         self, entity: Entity, author_id: str, change_description: str
     ) -> Entity:
@@ -290,82 +388,126 @@ class PublicationService:
         if not target_entity:
             raise ValueError(f"Target entity {target_entity_id} does not exist")
 
-        # Validate temporal consistency
-        if start_date and end_date and end_date < start_date:
-            raise ValueError("Relationship end_date cannot be before start_date")
-
-        # Validate relationship type
-        valid_types = [
-            "AFFILIATED_WITH",
-            "EMPLOYED_BY",
-            "MEMBER_OF",
-            "PARENT_OF",
-            "CHILD_OF",
-            "SUPERVISES",
-            "LOCATED_IN",
-            "FUNDED_BY",
-            "IMPLEMENTED_BY",
-            "EXECUTED_BY",
-            "OVERSEEN_BY",
-        ]
-        if relationship_type not in valid_types:
-            raise ValueError(
-                f"Invalid relationship type: {relationship_type}. Must be one of {valid_types}"
-            )
+        self._validate_new_relationship(relationship_type, start_date, end_date)
 
         # Get or create author
         author = await self._get_or_create_author(author_id)
 
-        # Create version summary
-        # Note: We need to create the relationship first to get its ID
-        relationship_data = {
-            "source_entity_id": source_entity_id,
-            "target_entity_id": target_entity_id,
-            "type": relationship_type,
-            "start_date": start_date,
-            "end_date": end_date,
-            "attributes": attributes,
-            "created_at": datetime.now(UTC),
-        }
-
-        # Create temporary relationship to get ID
-        temp_relationship = Relationship.model_validate(relationship_data)
-        relationship_id = temp_relationship.id
-
-        # Create version summary
-        version_summary = VersionSummary(
-            entity_or_relationship_id=relationship_id,
-            type=VersionType.RELATIONSHIP,
-            version_number=1,
-            author=author,
-            change_description=change_description,
-            created_at=datetime.now(UTC),
+        relationship, version = self._build_new_relationship(
+            source_entity_id,
+            target_entity_id,
+            relationship_type,
+            author,
+            change_description,
+            start_date,
+            end_date,
+            attributes,
         )
 
-        # Add version summary to relationship data
-        relationship_data["version_summary"] = version_summary
-
-        # Create final relationship
-        relationship = Relationship.model_validate(relationship_data)
-
         # Store relationship in database
         await self.database.put_relationship(relationship)
 
-        # Create and store version with snapshot
-        version = Version(
-            entity_or_relationship_id=relationship_id,
-            type=VersionType.RELATIONSHIP,
-            version_number=1,
-            author=author,
-            change_description=change_description,
-            created_at=version_summary.created_at,
-            snapshot=relationship.model_dump(mode="json"),
-        )
+        # Store version with snapshot
         await self.database.put_version(version)
 
-        logger.info(f"Created relationship {relationship_id} version 1")
+        logger.info(f"Created relationship {relationship.id} version 1")
         return relationship
 
+    async def create_relationships_bulk(
+        self,
+        relationships_data: List[Dict[str, Any]],
+        author_id: str,
+    ) -> List[Relationship]:
+        """Create many relationships in a single pass.
+
+        Each item takes the keyword arguments of create_relationship other
+        than author_id: source_entity_id, target_entity_id, relationship_type
+        and change_description, plus optional start_date, end_date and
+        attributes. Every relationship is validated and every referenced
+        entity is checked (once per distinct ID) before anything is written,
+        so an invalid item fails the whole batch without partial writes. If
+        storing fails midway, the relationships already stored are deleted.
+
+        Args:
+            relationships_data: List of relationship data dictionaries
+            author_id: ID of the author creating the relationships
+
+        Returns:
+            Created relationships (each with version 1), in input order
+
+        Raises:
+            ValueError: If any relationship is invalid or references a
+                missing entity
+        """
+        if not relationships_data:
+            return []
+
+        for data in relationships_data:
+            self._validate_new_relationship(
+                data["relationship_type"], data.get("start_date"), data.get("end_date")
+            )
+
+        entity_ids = list(
+            dict.fromkeys(
+                entity_id
+                for data in relationships_data
+                for entity_id in (data["source_entity_id"], data["target_entity_id"])
+            )
+        )
+        found = await asyncio.gather(
+            *(self.database.get_entity(entity_id) for entity_id in entity_ids)
+        )
+        missing = {
+            entity_id for entity_id, entity in zip(entity_ids, found) if not entity
+        }
+        for data in relationships_data:
+            if data["source_entity_id"] in missing:
+                raise ValueError(
+                    f"Source entity {data['source_entity_id']} does not exist"
+                )
+            if data["target_entity_id"] in missing:
+                raise ValueError(
+                    f"Target entity {data['target_entity_id']} does not exist"
+                )
+
+        author = await self._get_or_create_author(author_id)
+
+        prepared = [
+            self._build_new_relationship(
+                data["source_entity_id"],
+                data["target_entity_id"],
+                data["relationship_type"],
+                author,
+                data["change_description"],
+                data.get("start_date"),
+                data.get("end_date"),
+                data.get("attributes"),
+            )
+            for data in relationships_data
+        ]
+
+        relationships = []
+        undo_steps = []
+        try:
+            for relationship, version in prepared:
+                await self.database.put_relationship(relationship)
+                undo_steps.append(
+                    functools.partial(
+                        self.database.delete_relationship, relationship.id
+                    )
+                )
+                await self.database.put_version(version)
+                undo_steps.append(
+                    functools.partial(self.database.delete_version, version.id)
+                )
+                relationships.append(relationship)
+        except Exception:
+            await self._undo_bulk_writes(undo_steps)
+            raise
+
+        logger.info(f"Created {len(relationships)} relationships in bulk")
+        return relationships
+
     async def update_relationship(
         self, relationship: Relationship, author_id: str, change_description: str
     ) -> Relationship:
@@ -638,6 +780,244 @@ class PublicationService:
 
         return author
 
+    def _validate_new_entity_data(self, entity_data: Dict[str, Any]) -> None:
+        """Check the fields every new entity must carry.
+
+        Args:
+            entity_data: Dictionary containing entity data
+
+        Raises:
+            ValueError: If slug or a PRIMARY name is missing
+        """
+        if "slug" not in entity_data:
+            raise ValueError("Entity must have a 'slug' field")
+        if "names" not in entity_data or not entity_data["names"]:
+            raise ValueError("Entity must have at least one name")
+
+        # Validate that at least one name has kind='PRIMARY'
+        has_primary = any(
+            name.get("kind") == "PRIMARY" or name.get("kind") == NameKind.PRIMARY
+            for name in entity_data["names"]
+        )
+        if not has_primary:
+            raise ValueError("Entity must have at least one name with kind='PRIMARY'")
+
+    def _build_new_entity(
+        self,
+        entity_id: str,
+        entity_type: EntityType,
+        entity_subtype: Optional[EntitySubType],
+        entity_data: Dict[str, Any],
+        author: Author,
+        change_description: str,
+    ) -> tuple:
+        """Instantiate a new entity and its version 1 snapshot.
+
+        Args:
+            entity_id: ID of the new entity
+            entity_type: Type of the entity
+            entity_subtype: Optional subtype of the entity
+            entity_data: Dictionary containing entity data (updated in place)
+            author: Author of the change
+            change_description: Description of this change
+
+        Returns:
+            Tuple of (entity, version)
+        """
+        version_summary = self._stamp_new_entity_data(
+            entity_id,
+            entity_type,
+            entity_subtype,
+            entity_data,
+            author,
+            change_description,
+        )
+        entity = self._create_entity_instance(entity_data)
+        return entity, self._build_first_version(entity, version_summary)
+
+    def _stamp_new_entity_data(
+        self,
+        entity_id: str,
+        entity_type: EntityType,
+        entity_subtype: Optional[EntitySubType],
+        entity_data: Dict[str, Any],
+        author: Author,
+        change_description: str,
+    ) -> VersionSummary:
+        """Add type, subtype, version 1 summary and created_at to entity data.
+
+        Args:
+            entity_id: ID of the new entity
+            entity_type: Type of the entity
+            entity_subtype: Optional subtype of the entity
+            entity_data: Dictionary containing entity data (updated in place)
+            author: Author of the change
+            change_description: Description of this change
+
+        Returns:
+            The version summary added to the entity data
+        """
+        # Create version summary
+        version_summary = VersionSummary(
+            entity_or_relationship_id=entity_id,
+            type=VersionType.ENTITY,
+            version_number=1,
+            author=author,
+            change_description=change_description,
+            created_at=datetime.now(UTC),
+        )
+
+        # Add type, subtype, version summary and created_at to entity data
+        entity_data["type"] = entity_type.value
+        if entity_subtype:
+            entity_data["sub_type"] = entity_subtype.value
+        entity_data["version_summary"] = version_summary
+        entity_data["created_at"] = datetime.now(UTC)
+        return version_summary
+
+    async def _undo_bulk_writes(self, undo_steps: List[functools.partial]) -> None:
+        """Delete what a failed bulk write stored, newest first (best effort).
+
+        Args:
+            undo_steps: Delete calls for each stored entity, relationship or
+                version, in write order
+        """
+        for undo in reversed(undo_steps):
+            try:
+                await undo()
+            except Exception as e:
+                logger.warning(f"Failed to undo bulk write {undo.args[0]}: {e}")
+
+    def _build_first_version(
+        self, entity: Entity, version_summary: VersionSummary
+    ) -> Version:
+        """Build the version 1 snapshot of a newly created entity.
+
+        Args:
+            entity: The new entity
+            version_summary: Version summary stamped on the entity
+
+        Returns:
+            Version with a snapshot of the entity
+        """
+        return Version(
+            entity_or_relationship_id=version_summary.entity_or_relationship_id,
+            type=VersionType.ENTITY,
+            version_number=1,
+            author=version_summary.author,
+            change_description=version_summary.change_description,
+            created_at=version_summary.created_at,
+            snapshot=entity.model_dump(mode="json"),
+        )
+
+    def _validate_new_relationship(
+        self,
+        relationship_type: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> None:
+        """Check the type and dates of a new relationship.
+
+        Args:
+            relationship_type: Type of relationship
+            start_date: Optional start date of the relationship
+            end_date: Optional end date of the relationship
+
+        Raises:
+            ValueError: If the dates are inconsistent or the type is unknown
+        """
+        # Validate temporal consistency
+        if start_date and end_date and end_date < start_date:
+            raise ValueError("Relationship end_date cannot be before start_date")
+
+        # Validate relationship type
+        valid_types = [
+            "AFFILIATED_WITH",
+            "EMPLOYED_BY",
+            "MEMBER_OF",
+            "PARENT_OF",
+            "CHILD_OF",
+            "SUPERVISES",
+            "LOCATED_IN",
+            "FUNDED_BY",
+            "IMPLEMENTED_BY",
+            "EXECUTED_BY",
+            "OVERSEEN_BY",
+        ]
+        if relationship_type not in valid_types:
+            raise ValueError(
+                f"Invalid relationship type: {relationship_type}. Must be one of {valid_types}"
+            )
+
+    def _build_new_relationship(
+        self,
+        source_entity_id: str,
+        target_entity_id: str,
+        relationship_type: str,
+        author: Author,
+        change_description: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> tuple:
+        """Instantiate a new relationship and its version 1 snapshot.
+
+        Args:
+            source_entity_id: ID of the source entity
+            target_entity_id: ID of the target entity
+            relationship_type: Type of relationship
+            author: Author of the change
+            change_description: Description of this change
+            start_date: Optional start date of the relationship
+            end_date: Optional end date of the relationship
+            attributes: Optional additional attributes
+
+        Returns:
+            Tuple of (relationship, version)
+        """
+        # Note: We need to create the relationship first to get its ID
+        relationship_data = {
+            "source_entity_id": source_entity_id,
+            "target_entity_id": target_entity_id,
+            "type": relationship_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "attributes": attributes,
+            "created_at": datetime.now(UTC),
+        }
+
+        # Create temporary relationship to get ID
+        temp_relationship = Relationship.model_validate(relationship_data)
+        relationship_id = temp_relationship.id
+
+        # Create version summary
+        version_summary = VersionSummary(
+            entity_or_relationship_id=relationship_id,
+            type=VersionType.RELATIONSHIP,
+            version_number=1,
+            author=author,
+            change_description=change_description,
+            created_at=datetime.now(UTC),
+        )
+
+        # Add version summary to relationship data
+        relationship_data["version_summary"] = version_summary
+
+        # Create final relationship
+        relationship = Relationship.model_validate(relationship_data)
+
+        # Create version with snapshot
+        version = Version(
+            entity_or_relationship_id=relationship_id,
+            type=VersionType.RELATIONSHIP,
+            version_number=1,
+            author=author,
+            change_description=change_description,
+            created_at=version_summary.created_at,
+            snapshot=relationship.model_dump(mode="json"),
+        )
+        return relationship, version
+
     def _create_entity_instance(self, entity_data: Dict[str, Any]) -> Entity:
         """Create an entity instance of the appropriate type.
 
@@ -647,6 +1027,20 @@ class PublicationService:
         Returns:
             Entity instance (Person, Organization, or Location)
 
+        Raises:
+            ValueError: If entity type is invalid
+        """
+        return self._entity_model_class(entity_data).model_validate(entity_data)
+
+    def _entity_model_class(self, entity_data: Dict[str, Any]) -> type:
+        """Pick the entity model class for the data's type and subtype.
+
+        Args:
+            entity_data: Dictionary containing entity data
+
+        Returns:
+            Entity model class (Person, Organization, Location, ...)
+
         Raises:
             ValueError: If entity type is invalid
         """
@@ -654,27 +1048,27 @@ class PublicationService:
         entity_subtype = entity_data.get("sub_type")
 
         if entity_type == "person" or entity_type == EntityType.PERSON:
-            return Person.model_validate(entity_data)
+            return Person
         elif entity_type == "organization" or entity_type == EntityType.ORGANIZATION:
             if (
                 entity_subtype == "political_party"
                 or entity_subtype == EntitySubType.POLITICAL_PARTY
             ):
-                return PoliticalParty.model_validate(entity_data)
+                return PoliticalParty
             elif (
                 entity_subtype == "government_body"
                 or entity_subtype == EntitySubType.GOVERNMENT_BODY
             ):
-                return GovernmentBody.model_validate(entity_data)
+                return GovernmentBody
             elif (
                 entity_subtype == "hospital" or entity_subtype == EntitySubType.HOSPITAL
             ):
-                return Hospital.model_validate(entity_data)
+                return Hospital
             else:
-                return Organization.model_validate(entity_data)
+                return Organization
         elif entity_type == "location" or entity_type == EntityType.LOCATION:
-            return Location.model_validate(entity_data)
+            return Location
         elif entity_type == "project" or entity_type == EntityType.PROJECT:
-            return Project.model_validate(entity_data)
+            return Project
         else:
             raise ValueError(f"Unknown entity type: {entity_type}")
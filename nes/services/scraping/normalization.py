@@ -201,22 +201,14 @@ class NameExtractor:
         Returns:
             Standardized name
         """
-        # Remove extra whitespace
-        name = " ".join(name.split())
-
-        # Capitalize properly
+        # Split once: collapses extra whitespace and yields the words
         words = name.split()
-        standardized = []
-
-        for word in words:
-            # Keep all-caps acronyms
-            if word.isupper() and len(word) > 1:
-                standardized.append(word)
-            else:
-                # Capitalize first letter
-                standardized.append(word.capitalize())
 
-        return " ".join(standardized)
+        # Capitalize properly, keeping all-caps acronyms
+        return " ".join(
+            word if word.isupper() and len(word) > 1 else word.capitalize()
+            for word in words
+        )
 
 
 class AttributeExtractor:
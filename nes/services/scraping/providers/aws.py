@@ -81,6 +81,7 @@ class AWSBedrockProvider(BaseLLMProvider):
         aws_session_token: Optional[str] = None,
         profile_name: Optional[str] = None,
         enable_cache: bool = True,
+        max_pool_connections: int = 10,
     ):
         """Initialize the AWS Bedrock provider.
 
@@ -97,6 +98,8 @@ class AWSBedrockProvider(BaseLLMProvider):
             aws_session_token: AWS session token (optional)
             profile_name: AWS profile name from ~/.aws/credentials (optional)
             enable_cache: Enable response caching (default: True)
+            max_pool_connections: Connections kept in the client's pool; set it
+                to the number of concurrent requests (default: 10)
 
         Raises:
             ValueError: If model_id is not supported
@@ -130,6 +133,7 @@ class AWSBedrockProvider(BaseLLMProvider):
         """
         try:
             import boto3
+            from botocore.config import Config
         except ImportError:
             raise ImportError(
                 "boto3 is required for AWS Bedrock provider. "
@@ -171,7 +175,10 @@ class AWSBedrockProvider(BaseLLMProvider):
             session_kwargs["aws_session_token"] = aws_session_token
 
         session = boto3.Session(**session_kwargs)
-        self.client = session.client("bedrock-runtime")
+        self.client = session.client(
+            "bedrock-runtime",
+            config=Config(max_pool_connections=max_pool_connections),
+        )
 
         # Token usage tracking
         self.total_input_tokens = 0
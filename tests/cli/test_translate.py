@@ -448,3 +448,64 @@ class TestTranslateCLIStdinInput:
 
             assert result.exit_code == 0
             assert "राम चन्द्र पौडेल" in result.output
+
+    def test_translate_multiple_lines_from_stdin_as_one_block(self):
+        """Test that multi-line piped input is translated as one block by default."""
+        from nes.cli import cli
+
+        runner = CliRunner()
+
+        with patch("nes.cli.translate.get_translation_service") as mock_service:
+            mock_translator = AsyncMock()
+            mock_translator.translate.return_value = {
+                "translated_text": "राम चन्द्र पौडेल\nहर्क साम्पाङ",
+                "detected_language": "en",
+            }
+            mock_service.return_value = mock_translator
+
+            result = runner.invoke(
+                cli,
+                ["translate", "--to", "ne"],
+                input="Ram Chandra Poudel\n\nHarka Sampang\n",
+            )
+
+            assert result.exit_code == 0
+            mock_translator.translate.assert_called_once_with(
+                text="Ram Chandra Poudel\n\nHarka Sampang",
+                source_lang=None,
+                target_lang="ne",
+            )
+            assert "Detected language: English" in result.output
+            assert "Translation: राम चन्द्र पौडेल" in result.output
+
+    def test_translate_multiple_lines_from_stdin_per_line(self):
+        """Test that --lines translates each piped line separately, in order."""
+        from nes.cli import cli
+
+        runner = CliRunner()
+
+        translations = {
+            "Ram Chandra Poudel": "राम चन्द्र पौडेल",
+            "Harka Sampang": "हर्क साम्पाङ",
+        }
+
+        async def fake_translate(text, source_lang=None, target_lang=None):
+            return {"translated_text": translations[text]}
+
+        with patch("nes.cli.translate.get_translation_service") as mock_service:
+            mock_translator = AsyncMock()
+            mock_translator.translate.side_effect = fake_translate
+            mock_service.return_value = mock_translator
+
+            result = runner.invoke(
+                cli,
+                ["translate", "--lines", "--to", "ne"],
+                input="Ram Chandra Poudel\n\nHarka Sampang\n",
+            )
+
+            assert result.exit_code == 0
+            assert mock_translator.translate.call_count == 2
+            assert result.output.splitlines() == [
+                "राम चन्द्र पौडेल",
+                "हर्क साम्पाङ",
+            ]
@@ -278,3 +278,20 @@ def test_candidacy_validates_entity_ids():
                 nec_id=2,
             ),
         )
+
+
+def test_candidacy_is_immutable():
+    """Test that candidacy records are frozen and changed via model_copy."""
+    candidacy = Candidacy(
+        candidate_id=12345,
+        election_year=2022,
+        election_type=ElectionType.FEDERAL,
+        constituency_id="entity:location/constituency/kathmandu-1",
+    )
+
+    with pytest.raises(ValidationError):
+        candidacy.elected = True
+
+    updated = candidacy.model_copy(update={"elected": True})
+    assert updated.elected is True
+    assert candidacy.elected is None
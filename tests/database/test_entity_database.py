@@ -39,6 +39,8 @@ class TestEntityDatabaseInterface:
             "get_entity",
             "delete_entity",
             "list_entities",
+            "list_entities_raw",
+            "count_entities",
             "put_relationship",
             "get_relationship",
             "delete_relationship",
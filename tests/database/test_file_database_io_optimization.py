@@ -433,3 +433,40 @@ class TestDirectoryTraversalOptimization:
         # Verify no overlap
         all_ids = [e.id for e in page1] + [e.id for e in page2] + [e.id for e in page3]
         assert len(all_ids) == len(set(all_ids))  # All unique
+
+    @pytest.mark.asyncio
+    async def test_list_entities_raw_returns_stored_dicts(self, complex_db):
+        """Test that list_entities_raw returns plain dicts without validation."""
+        results = await complex_db.list_entities_raw(
+            entity_type="organization", sub_type="political_party", limit=100
+        )
+
+        assert len(results) == 5
+        assert all(isinstance(data, dict) for data in results)
+        assert all(data["sub_type"] == "political_party" for data in results)
+        # Computed fields are stripped on write and not re-added
+        assert all("id" not in data for data in results)
+
+    @pytest.mark.asyncio
+    async def test_list_entities_raw_matches_list_entities(self, complex_db):
+        """Test that list_entities_raw covers the same entities as list_entities."""
+        entities = await complex_db.list_entities(limit=100)
+        raw = await complex_db.list_entities_raw(limit=100)
+
+        assert sorted(e.slug for e in entities) == sorted(d["slug"] for d in raw)
+
+        page = await complex_db.list_entities_raw(limit=5, offset=5)
+        assert len(page) == 5
+
+    @pytest.mark.asyncio
+    async def test_count_entities_matches_list_entities(self, complex_db):
+        """Test that count_entities agrees with list_entities without loading."""
+        total = await complex_db.count_entities()
+        assert total == len(await complex_db.list_entities(limit=1000))
+
+        parties = await complex_db.count_entities(
+            entity_type="organization", sub_type="political_party"
+        )
+        assert parties == 5
+
+        assert await complex_db.count_entities(entity_type="nonexistent") == 0
@@ -301,6 +301,46 @@ class TestReadOperations:
         assert len(results) == 1
         assert results[0].slug == "nepali-congress"
 
+    @pytest.mark.asyncio
+    async def test_list_entities_raw_reads_from_cache(self, temp_db_path):
+        """list_entities_raw should return cached entities as dicts."""
+        underlying_db = FileDatabase(base_path=str(temp_db_path))
+
+        for i in range(3):
+            await underlying_db.put_entity(create_person(f"person-{i}", f"P {i}"))
+        await underlying_db.put_entity(
+            create_political_party("nepali-congress", "Nepali Congress")
+        )
+
+        cached_db = InMemoryCachedReadDatabase(underlying_db)
+
+        raw = await cached_db.list_entities_raw(entity_type="person")
+        assert sorted(e["slug"] for e in raw) == ["person-0", "person-1", "person-2"]
+        assert all(isinstance(e, dict) for e in raw)
+
+    @pytest.mark.asyncio
+    async def test_count_entities_reads_from_cache(self, temp_db_path):
+        """count_entities should count cached entities by type/subtype."""
+        underlying_db = FileDatabase(base_path=str(temp_db_path))
+
+        for i in range(3):
+            await underlying_db.put_entity(create_person(f"person-{i}", f"P {i}"))
+        await underlying_db.put_entity(
+            create_political_party("nepali-congress", "Nepali Congress")
+        )
+
+        cached_db = InMemoryCachedReadDatabase(underlying_db)
+
+        assert await cached_db.count_entities() == 4
+        assert await cached_db.count_entities(entity_type="person") == 3
+        assert (
+            await cached_db.count_entities(
+                entity_type="organization", sub_type="political_party"
+            )
+            == 1
+        )
+        assert await cached_db.count_entities(entity_type="location") == 0
+
     @pytest.mark.asyncio
     async def test_list_relationships_returns_all_cached_relationships(
         self, temp_db_path
@@ -5,14 +5,17 @@ This module tests migration discovery, applied migration tracking,
 and pending migration detection.
 """
 
+import os
 import subprocess
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from nes.services.migration import Migration, MigrationManager
+from nes.services.migration.manager import _METADATA_RE
 
 
 @pytest.fixture
@@ -117,6 +120,128 @@ async def test_discover_migrations(temp_migrations_dir, temp_db_repo):
     assert migrations[1].full_name == "001-another-migration"
 
 
+@pytest.mark.asyncio
+async def test_discover_migrations_reuses_parsed_metadata(
+    temp_migrations_dir, temp_db_repo
+):
+    """Test that unchanged scripts are parsed once and edited ones again."""
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+
+    with patch(
+        "nes.services.migration.manager._METADATA_RE", wraps=_METADATA_RE
+    ) as mock_re:
+        await manager.discover_migrations()
+        manager.clear_cache()
+        await manager.discover_migrations()
+        assert mock_re.finditer.call_count == 2
+
+        script = temp_migrations_dir / "000-test-migration" / "migrate.py"
+        script.write_text(script.read_text().replace("Test migration", "Edited"))
+        stat = script.stat()
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        manager.clear_cache()
+        migrations = await manager.discover_migrations()
+        assert mock_re.finditer.call_count == 3
+        assert migrations[0].description == "Edited for unit tests"
+
+
+@pytest.mark.asyncio
+async def test_discover_migrations_cached_until_folders_change(
+    temp_migrations_dir, temp_db_repo
+):
+    """Test that discovery is reused until a migration folder or script changes."""
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+
+    def bump_mtime(path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    # A folder whose script is added only after the first discovery
+    late_migration = temp_migrations_dir / "002-late-script"
+    late_migration.mkdir()
+
+    with patch.object(
+        manager, "_load_migration_folder", wraps=manager._load_migration_folder
+    ) as mock_load:
+        first = await manager.discover_migrations()
+        loads = mock_load.call_count
+        second = await manager.discover_migrations()
+        assert mock_load.call_count == loads
+        assert [m.full_name for m in second] == [m.full_name for m in first]
+        assert await manager.get_migration_by_name("002-late-script") is None
+
+        (late_migration / "migrate.py").write_text('AUTHOR = "late@example.com"\n')
+        bump_mtime(late_migration)
+
+        script = temp_migrations_dir / "000-test-migration" / "migrate.py"
+        script.write_text(script.read_text().replace("Test migration", "Edited"))
+        bump_mtime(script)
+
+        third = await manager.discover_migrations()
+        assert mock_load.call_count > loads
+        assert third[0].description == "Edited for unit tests"
+        assert third[-1].full_name == "002-late-script"
+        late = await manager.get_migration_by_name("002-late-script")
+        assert late is not None
+        assert late.author == "late@example.com"
+
+
+@pytest.mark.asyncio
+async def test_discover_migrations_reads_non_literal_metadata(
+    temp_migrations_dir, temp_db_repo
+):
+    """Test that metadata the fast path can't read falls back to the AST."""
+    script = temp_migrations_dir / "001-another-migration" / "migrate.py"
+    script.write_text(
+        '''
+AUTHOR = "test2@example.com"  # maintainer
+DATE = "2024-01-21"
+DESCRIPTION = """Another "quoted" migration"""
+'''
+    )
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+
+    migrations = await manager.discover_migrations()
+
+    assert migrations[1].author == "test2@example.com"
+    assert migrations[1].date == datetime(2024, 1, 21)
+    assert migrations[1].description == 'Another "quoted" migration'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "date_str,expected",
+    [
+        ("2024-01-05", datetime(2024, 1, 5)),
+        ("2024-1-5", datetime(2024, 1, 5)),
+        ("20240105", None),
+        ("2024-01-05T10:00", None),
+    ],
+)
+async def test_discover_migrations_parses_date_like_validator(
+    temp_migrations_dir, temp_db_repo, date_str, expected
+):
+    """Test that discovery accepts exactly the DATE values the validator does."""
+    from nes.services.migration.validation import validate_migration_metadata
+
+    script = temp_migrations_dir / "001-another-migration" / "migrate.py"
+    script.write_text(
+        f"""
+AUTHOR = "test2@example.com"
+DATE = "{date_str}"
+DESCRIPTION = "Another test migration"
+"""
+    )
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+
+    migrations = await manager.discover_migrations()
+
+    assert migrations[1].date == expected
+    date_errors = [e for e in validate_migration_metadata(script).errors if "DATE" in e]
+    assert bool(date_errors) == (expected is None)
+
+
 @pytest.mark.asyncio
 async def test_get_applied_migrations_empty(temp_migrations_dir, temp_db_repo):
     """Test getting applied migrations when none have been applied."""
@@ -203,6 +328,30 @@ async def test_get_pending_migrations(temp_migrations_dir, temp_db_repo):
     assert pending[0].full_name == "001-another-migration"
 
 
+@pytest.mark.asyncio
+async def test_get_pending_migrations_skips_applied_scripts(
+    temp_migrations_dir, temp_db_repo
+):
+    """Test that scripts of applied migrations are not read for pending."""
+    log_dir = temp_db_repo / "v2" / "migration-logs" / "000-test-migration"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    (log_dir / "metadata.json").write_text('{"status": "completed"}')
+
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+
+    with patch.object(
+        manager,
+        "_load_migration_metadata",
+        wraps=manager._load_migration_metadata,
+    ) as mock_load:
+        pending = await manager.get_pending_migrations()
+
+    assert [m.full_name for m in pending] == ["001-another-migration"]
+    assert [call.args[0].parent.name for call in mock_load.call_args_list] == [
+        "001-another-migration"
+    ]
+
+
 @pytest.mark.asyncio
 async def test_is_migration_applied(temp_migrations_dir, temp_db_repo):
     """Test checking if a specific migration is applied."""
@@ -10,8 +10,10 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-# Mock boto3 before importing the provider
+# Mock boto3 and botocore before importing the provider
 sys.modules["boto3"] = MagicMock()
+sys.modules["botocore"] = MagicMock()
+sys.modules["botocore.config"] = MagicMock()
 
 
 class TestAWSBedrockProviderInitialization:
@@ -88,6 +90,22 @@ class TestAWSBedrockProviderInitialization:
             # Verify Session was called with credentials
             mock_session.assert_called_once()
 
+    def test_provider_initialization_client_pool_size(self):
+        """Test that the client pool size is configurable, with default retries."""
+        with patch("boto3.Session") as mock_session, patch(
+            "botocore.config.Config"
+        ) as mock_config:
+            from nes.services.scraping.providers import AWSBedrockProvider
+
+            AWSBedrockProvider()
+            mock_config.assert_called_with(max_pool_connections=10)
+
+            AWSBedrockProvider(max_pool_connections=32)
+            mock_config.assert_called_with(max_pool_connections=32)
+            mock_session.return_value.client.assert_called_with(
+                "bedrock-runtime", config=mock_config.return_value
+            )
+
 
 class TestAWSBedrockProviderTextGeneration:
     """Test text generation capabilities."""
@@ -13,12 +13,13 @@ The Publication Service is the central orchestration layer that manages:
 
 from datetime import UTC, date, datetime
 from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
 from nes.core.models.base import Name, NameKind
 from nes.core.models.entity import EntitySubType, EntityType
-from nes.core.models.organization import PoliticalParty
+from nes.core.models.organization import Hospital, PoliticalParty
 from nes.core.models.person import Person
 from nes.core.models.relationship import Relationship
 from nes.core.models.version import Author, Version, VersionSummary, VersionType
@@ -413,6 +414,145 @@ class TestPublicationServiceRelationshipCreation:
                 change_description="Test",
             )
 
+    @pytest.mark.asyncio
+    async def test_create_relationships_bulk(self, temp_db_path):
+        """Test bulk creation of relationships with versioning."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        people = await service.create_entities_bulk(
+            entity_type=EntityType.PERSON,
+            entities_data=[
+                {
+                    "slug": f"bulk-member-{i}",
+                    "names": [{"kind": "PRIMARY", "en": {"full": f"Member {i}"}}],
+                }
+                for i in range(2)
+            ],
+            author_id="author:test",
+        )
+        org = await service.create_entity(
+            EntityType.ORGANIZATION,
+            {
+                "slug": "bulk-rel-party",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Bulk Rel Party"}}],
+            },
+            "author:test",
+            "Test",
+            EntitySubType.POLITICAL_PARTY,
+        )
+
+        relationships = await service.create_relationships_bulk(
+            relationships_data=[
+                {
+                    "source_entity_id": person.id,
+                    "target_entity_id": org.id,
+                    "relationship_type": "MEMBER_OF",
+                    "change_description": f"{person.slug} joined",
+                }
+                for person in people
+            ],
+            author_id="author:test",
+        )
+
+        assert [r.source_entity_id for r in relationships] == [p.id for p in people]
+        for relationship in relationships:
+            assert relationship.target_entity_id == org.id
+            assert relationship.version_summary.version_number == 1
+            assert await db.get_relationship(relationship.id) is not None
+            versions = await service.get_relationship_versions(relationship.id)
+            assert len(versions) == 1
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_bulk_undoes_partial_writes(self, temp_db_path):
+        """Test that a storage failure midway removes the relationships stored."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        people = await service.create_entities_bulk(
+            entity_type=EntityType.PERSON,
+            entities_data=[
+                {
+                    "slug": f"bulk-undo-member-{i}",
+                    "names": [{"kind": "PRIMARY", "en": {"full": f"Member {i}"}}],
+                }
+                for i in range(3)
+            ],
+            author_id="author:test",
+        )
+
+        put_relationship = db.put_relationship
+        calls = 0
+
+        async def failing_put_relationship(relationship):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise OSError("disk full")
+            return await put_relationship(relationship)
+
+        with patch.object(db, "put_relationship", side_effect=failing_put_relationship):
+            with pytest.raises(OSError, match="disk full"):
+                await service.create_relationships_bulk(
+                    relationships_data=[
+                        {
+                            "source_entity_id": person.id,
+                            "target_entity_id": people[0].id,
+                            "relationship_type": "MEMBER_OF",
+                            "change_description": "Test",
+                        }
+                        for person in people
+                    ],
+                    author_id="author:test",
+                )
+
+        assert await db.list_relationships() == []
+
+    @pytest.mark.asyncio
+    async def test_create_relationships_bulk_rejects_batch_without_partial_writes(
+        self, temp_db_path
+    ):
+        """Test that one invalid relationship fails the batch before any write."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        person = await service.create_entity(
+            EntityType.PERSON,
+            {
+                "slug": "bulk-rel-person",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Bulk Rel Person"}}],
+            },
+            "author:test",
+            "Test",
+        )
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await service.create_relationships_bulk(
+                relationships_data=[
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": person.id,
+                        "relationship_type": "AFFILIATED_WITH",
+                        "change_description": "Valid",
+                    },
+                    {
+                        "source_entity_id": person.id,
+                        "target_entity_id": "entity:organization/political_party/missing",
+                        "relationship_type": "MEMBER_OF",
+                        "change_description": "Missing target",
+                    },
+                ],
+                author_id="author:test",
+            )
+
+        assert await service.get_relationships_by_entity(person.id) == []
+
 
 class TestPublicationServiceRelationshipUpdates:
     """Test relationship updates with versioning."""
@@ -697,6 +837,177 @@ class TestPublicationServiceCoordinatedOperations:
         assert len(results) == 3
         assert all(e.version_summary.version_number == 1 for e in results)
 
+    @pytest.mark.asyncio
+    async def test_create_entities_bulk(self, temp_db_path):
+        """Test bulk creation of entities sharing a type and subtype."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entities_data = [
+            {
+                "slug": f"bulk-party-{i}",
+                "names": [{"kind": "PRIMARY", "en": {"full": f"Bulk Party {i}"}}],
+            }
+            for i in range(3)
+        ]
+
+        results = await service.create_entities_bulk(
+            entity_type=EntityType.ORGANIZATION,
+            entity_subtype=EntitySubType.POLITICAL_PARTY,
+            entities_data=entities_data,
+            author_id="author:test",
+            change_description="Bulk import",
+        )
+
+        assert [e.slug for e in results] == [f"bulk-party-{i}" for i in range(3)]
+        for entity in results:
+            assert isinstance(entity, PoliticalParty)
+            assert await db.get_entity(entity.id) is not None
+            versions = await service.get_entity_versions(entity.id)
+            assert len(versions) == 1
+
+    @pytest.mark.asyncio
+    async def test_create_entities_bulk_rejects_batch_without_partial_writes(
+        self, temp_db_path
+    ):
+        """Test that one invalid entity fails the bulk batch before any write."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entities_data = [
+            {
+                "slug": "bulk-ok",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Bulk OK"}}],
+            },
+            {
+                "slug": "bulk-ok",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Bulk Duplicate"}}],
+            },
+        ]
+
+        with pytest.raises(ValueError, match="Duplicate slug"):
+            await service.create_entities_bulk(
+                entity_type=EntityType.PERSON,
+                entities_data=entities_data,
+                author_id="author:test",
+            )
+
+        assert await db.get_entity("entity:person/bulk-ok") is None
+
+    @pytest.mark.asyncio
+    async def test_create_entities_bulk_uses_record_subtype_for_duplicates(
+        self, temp_db_path
+    ):
+        """Test that a record's sub_type is used to find existing entities."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        def party_data():
+            return {
+                "slug": "bulk-x-party",
+                "sub_type": "political_party",
+                "names": [{"kind": "PRIMARY", "en": {"full": "X Party"}}],
+            }
+
+        await service.create_entity(
+            entity_type=EntityType.ORGANIZATION,
+            entity_data=party_data(),
+            author_id="author:test",
+        )
+
+        with pytest.raises(ValueError, match="already exists"):
+            await service.create_entities_bulk(
+                entity_type=EntityType.ORGANIZATION,
+                entities_data=[party_data()],
+                author_id="author:test",
+            )
+
+        versions = await service.get_entity_versions(
+            "entity:organization/political_party/bulk-x-party"
+        )
+        assert len(versions) == 1
+
+    @pytest.mark.asyncio
+    async def test_create_entities_bulk_mixed_subtypes(self, temp_db_path):
+        """Test that a batch mixing subtypes validates each with its model."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entities_data = [
+            {
+                "slug": "bulk-mixed-hospital",
+                "sub_type": "hospital",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Mixed Hospital"}}],
+            },
+            {
+                "slug": "bulk-mixed-party",
+                "sub_type": "political_party",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Mixed Party"}}],
+            },
+        ]
+
+        results = await service.create_entities_bulk(
+            entity_type=EntityType.ORGANIZATION,
+            entities_data=entities_data,
+            author_id="author:test",
+        )
+
+        assert [e.id for e in results] == [
+            "entity:organization/hospital/bulk-mixed-hospital",
+            "entity:organization/political_party/bulk-mixed-party",
+        ]
+        assert isinstance(results[0], Hospital)
+        assert isinstance(results[1], PoliticalParty)
+        for entity in results:
+            assert await db.get_entity(entity.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_create_entities_bulk_undoes_partial_writes(self, temp_db_path):
+        """Test that a storage failure midway removes the entities stored."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entities_data = [
+            {
+                "slug": f"bulk-undo-{i}",
+                "names": [{"kind": "PRIMARY", "en": {"full": f"Bulk Undo {i}"}}],
+            }
+            for i in range(3)
+        ]
+
+        put_version = db.put_version
+        calls = 0
+
+        async def failing_put_version(version):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise OSError("disk full")
+            return await put_version(version)
+
+        with patch.object(db, "put_version", side_effect=failing_put_version):
+            with pytest.raises(OSError, match="disk full"):
+                await service.create_entities_bulk(
+                    entity_type=EntityType.PERSON,
+                    entities_data=entities_data,
+                    author_id="author:test",
+                )
+
+        for i in range(3):
+            entity_id = f"entity:person/bulk-undo-{i}"
+            assert await db.get_entity(entity_id) is None
+            assert await service.get_entity_versions(entity_id) == []
+
 
 class TestPublicationServiceRollback:
     """Test rollback mechanisms for failed operations."""